@@ -13,7 +13,8 @@ from asyncio import Future
 from asyncio import sleep
 from typing import Awaitable
 from typing import Callable
-from typing import List
+from typing import Deque
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
@@ -38,6 +39,28 @@ from legoBTLE.networking.prettyprint.debug import debug_info_end
 from legoBTLE.networking.prettyprint.debug import debug_info_footer
 from legoBTLE.networking.prettyprint.debug import debug_info_header
 
+_DELAY_BEFORE_START = (f"DELAY_BEFORE / {C.WARNING}{{name}} {C.WARNING}WAITING FOR {{delay}}... "
+                       f"{C.BOLD}{C.OKBLUE}START{C.ENDC}")
+_DELAY_BEFORE_DONE = (f"DELAY_BEFORE / {C.WARNING}{{name}} {C.WARNING}WAITING FOR {{delay}}... "
+                      f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}")
+_DELAY_AFTER_START = (f"DELAY_AFTER / {C.WARNING}{{name}} {C.WARNING}WAITING FOR {{delay}}... "
+                      f"{C.BOLD}{C.OKBLUE}START{C.ENDC}")
+_DELAY_AFTER_DONE = (f"DELAY_AFTER / {C.WARNING}{{name}} {C.WARNING}WAITING FOR {{delay}}... "
+                     f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}")
+_RESET_GATES_WAITING = f"{{op}} +++ [{{name}}:{{port}}]: RESET AT THE GATES... \t{C.WARNING}WAITING...{C.ENDC}"
+_RESET_GATES_PASSED = f"{{op}} +++ [{{name}}:{{port}}]: RESET AT THE GATES... \t{C.OKBLUE}PASS... {C.ENDC}"
+
+# upstream message type -> notification setter the message is handed to by ADevice._dispatch_return_data
+_RETURN_DATA_SETTERS = {
+    MESSAGE_TYPE.UPS_PORT_VALUE[0]: 'port_value_set',
+    MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0]: 'cmd_feedback_notification_set',
+    MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR[0]: 'error_notification_set',
+    MESSAGE_TYPE.UPS_PORT_NOTIFICATION[0]: 'port_notification_set',
+    MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0]: 'hub_attached_io_notification_set',
+    MESSAGE_TYPE.UPS_DNS_HUB_ACTION[0]: 'hub_action_notification_set',
+    MESSAGE_TYPE.UPS_DNS_HUB_ALERT[0]: 'hub_alert_notification_set',
+}
+
 
 class ADevice(ABC):
     """Abstract Device
@@ -54,34 +77,41 @@ class ADevice(ABC):
        :class:`legoBTLE.device.SingleMotor.SynchronizedMotor.SynchronizedMotor`
        :class:`Hub`
     
+    Attributes
+    ----------
+    
+    NOTIFICATION_LOG_LEN : int, default 4096
+        The number of entries each notification log keeps. The logs are ring buffers, so a long running model keeps
+        the latest notifications without growing without bound.
+    
     """
     
+    __slots__ = ()
+    
+    NOTIFICATION_LOG_LEN: int = 4096
+    
     async def _delay_before(self, delay: float, when: str = 'n', cmd_id: str = f"DELAY BEFORE/AFTER SEND",
                             debug: bool = False):
-        if delay is not None:
+        if delay:
             if str.lower(when) == 'n':
                 _when = 'NO DELAY'
-                debug_info(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: IGNORE DELAY",
-                           debug=debug)
+                if debug:
+                    debug_info(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: IGNORE DELAY",
+                               debug=debug)
                 return
             elif str.lower(when) == 'b':
                 _when = 'BEFORE'
-                msg_a = debug_info_begin(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                         debug=debug)
-                msg_b = debug_info_end(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                       debug=debug)
             elif str.lower(when) == 'a':
                 _when = 'AFTER'
-                msg_a = debug_info_begin(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                         debug=debug)
-                msg_b = debug_info_end(f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: ",
-                                       debug=debug)
             else:
                 raise ValueError
             
-            debug_info_begin(msg_a, debug=debug)
+            if debug:
+                msg = f"[{self.name}:{self.port}].{cmd_id} delay {_when} is set to {delay}: "
+                debug_info_begin(msg, debug=debug)
             await sleep(delay)
-            debug_info_end(msg_b, debug=debug)
+            if debug:
+                debug_info_end(msg, debug=debug)
         return True
     
     @property
@@ -429,14 +459,14 @@ class ADevice(ABC):
     
     @property
     @abstractmethod
-    def hub_alert_notification_log(self) -> List[Tuple[float, HUB_ALERT_NOTIFICATION]]:
+    def hub_alert_notification_log(self) -> Deque[Tuple[float, HUB_ALERT_NOTIFICATION]]:
         """Returns the alert log.
 
         The log is a list of tuples comprising the timestamp of each alert and the alert itself.
 
         Returns
         -------
-        List[Tuple[float, HUB_ALERT_NOTIFICATION]]
+        Deque[Tuple[float, HUB_ALERT_NOTIFICATION]]
             A list of tuples comprising the timestamp of each alert and the alert itself
             
         """
@@ -486,7 +516,7 @@ class ADevice(ABC):
         raise NotImplementedError
     
     @property
-    def ext_srv_notification_log(self) -> List[Tuple[float, EXT_SERVER_NOTIFICATION]]:
+    def ext_srv_notification_log(self) -> Deque[Tuple[float, EXT_SERVER_NOTIFICATION]]:
         raise NotImplementedError
     
     async def EXT_SRV_DISCONNECT_REQ(self,
@@ -523,58 +553,69 @@ class ADevice(ABC):
         
         command = CMD_EXT_SRV_DISCONNECT_REQ(port=self.port)
         
-        debug_info_header(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD} +++ {cmd_id} +++ {C.ENDC}", debug=debug)
+        if debug:
+            debug_info_header(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD} +++ {cmd_id} +++ {C.ENDC}", debug=debug)
         if self.ext_srv_disconnected.set():
-            debug_info(f"[{self.name}:{self.port}] +++ {cmd_id}: ALREADY DISCONNECTED", debug=debug)
-            debug_info_footer(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD}+++ {cmd_id} +++ {C.ENDC}", debug=debug)
+            if debug:
+                debug_info(f"[{self.name}:{self.port}] +++ {cmd_id}: ALREADY DISCONNECTED", debug=debug)
+                debug_info_footer(f"[{self.name}:{self.port}] {C.OKBLUE}{C.BOLD}+++ {cmd_id} +++ {C.ENDC}", debug=debug)
             return True  # already disconnected
         else:
-            if delay_before is not None:
-                debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
-                                 f" WAITING FOR {delay_before}", debug=debug)
+            if delay_before:
+                if debug:
+                    debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
+                                     f" WAITING FOR {delay_before}", debug=debug)
                 
                 await sleep(delay_before)
                 
-                debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
-                               f"WAITING FOR {delay_before}", debug=debug)
+                if debug:
+                    debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE / {self.name} "
+                                   f"WAITING FOR {delay_before}", debug=debug)
             
-            debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
-                             debug=debug)
+            if debug:
+                debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
+                                 debug=debug)
             
             s = await self._cmd_send(command)
             
-            debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
-                           debug=debug)
+            if debug:
+                debug_info_end(f"{cmd_id} +++ [{self.name}:{self.port}]: SEND CMD: {command.COMMAND.hex()}",
+                               debug=debug)
             if not s:
-                debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed",
-                           debug=debug)
-                debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+                if debug:
+                    debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed",
+                               debug=debug)
+                    debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
                 raise ConnectionError(f"[{self.name}:??]- [MSG]: UNABLE TO ESTABLISH CONNECTION... aborting...")
             else:
                 try:
                     bytesToRead: bytes = await self.connection[0].readexactly(1)  # waiting for answer from Server
                     data = bytearray(await self.connection[0].readexactly(bytesToRead[0]))
                 except IncompleteReadError as ire:
-                    debug_info(
-                        f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed... "
-                        f"Server didn't answer... (->{ire.args})",
-                        debug=debug)
-                    debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+                    if debug:
+                        debug_info(
+                            f"{cmd_id} +++ [{self.name}:{self.port}]: Sending CMD_EXT_SRV_DISCONNECT_REQ: failed... "
+                            f"Server didn't answer... (->{ire.args})",
+                            debug=debug)
+                        debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
                     raise ire
                 else:
                     UpStreamMessageBuilder(data=data, debug=debug).dispatch()
-                    if delay_after is not None:
-                        debug_info_begin(
-                            f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
-                            debug=debug)
+                    if delay_after:
+                        if debug:
+                            debug_info_begin(
+                                f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
+                                debug=debug)
                         
                         await sleep(delay_after)
                         
-                        debug_info_end(
-                            f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
-                            debug=debug)
+                        if debug:
+                            debug_info_end(
+                                f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_AFTER / WAITING FOR {delay_after}",
+                                debug=debug)
         
-        debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+        if debug:
+            debug_info_footer(f"{cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
         return s
     
     async def RESET(self,
@@ -611,44 +652,43 @@ class ADevice(ABC):
         
         command = CMD_HW_RESET(port=self.port)
         
-        debug_info_header(f"THE {cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
-        debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: RESET AT THE GATES... \t{C.WARNING}WAITING...{C.ENDC}",
-                   debug=debug)
+        if debug:
+            debug_info_header(f"THE {cmd_id} +++ [{self.name}:{self.port}]", debug=debug)
+            debug_info(_RESET_GATES_WAITING.format(op=cmd_id, name=self.name, port=self.port), debug=debug)
         
         self.port_free.clear()
         
-        debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: RESET AT THE GATES... \t{C.OKBLUE}PASS... {C.ENDC}",
-                   debug=debug)
+        if debug:
+            debug_info(_RESET_GATES_PASSED.format(op=cmd_id, name=self.name, port=self.port), debug=debug)
         
-        if delay_before is not None:
-            debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE", debug=debug)
-            debug_info(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE... WAITING FOR {delay_before}..."
-                       f"{C.BOLD}{C.OKBLUE}START{C.ENDC}", debug=debug)
+        if delay_before:
+            if debug:
+                debug_info_begin(f"{cmd_id} +++ [{self.name}:{self.port}]: DELAY_BEFORE", debug=debug)
+                debug_info(_DELAY_BEFORE_START.format(name=self.name, delay=delay_before), debug=debug)
             await sleep(delay_before)
-            debug_info(f"DELAY_BEFORE / {C.WARNING}{self.name} {C.WARNING} WAITING FOR {delay_before}... "
-                       f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}", debug=debug)
+            if debug:
+                debug_info(_DELAY_BEFORE_DONE.format(name=self.name, delay=delay_before), debug=debug)
         
-        debug_info_begin(f"{self.name}.RESET({self.port[0]}) SENDING {command.COMMAND.hex()}...", debug)
+        if debug:
+            debug_info_begin(f"{self.name}.RESET({self.port[0]}) SENDING {command.COMMAND.hex()}...", debug)
         
         if wait_cond:
-            wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-            await asyncio.wait({wcd}, timeout=wait_cond_timeout)
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
         
         s = await self._cmd_send(command)
         
-        debug_info_end(f"{self.name}.RESET({self.port[0]}) SENDING COMPLETE...", debug)
+        if debug:
+            debug_info_end(f"{self.name}.RESET({self.port[0]}) SENDING COMPLETE...", debug)
         
-        if delay_after is not None:
+        if delay_after:
             
-            debug_info_begin(f"DELAY_AFTER / {C.WARNING}{self.name} "
-                             f"{C.WARNING}WAITING FOR {delay_after}... "
-                             f"{C.BOLD}{C.OKBLUE}START{C.ENDC}", debug=debug)
+            if debug:
+                debug_info_begin(_DELAY_AFTER_START.format(name=self.name, delay=delay_after), debug=debug)
             
             await sleep(delay_after)
             
-            debug_info_begin("DELAY_AFTER / {C.WARNING}{self.name} "
-                             f"{C.WARNING}WAITING FOR {delay_after}... "
-                             f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}", debug=debug)
+            if debug:
+                debug_info_end(_DELAY_AFTER_DONE.format(name=self.name, delay=delay_after), debug=debug)
         self.port_free.set()
         return s
     
@@ -675,33 +715,26 @@ class ADevice(ABC):
         """
         
         command = CMD_PORT_NOTIFICATION_DEV_REQ(port=self.port)
-        async with self.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            
+        await self._acquire_port()
+        try:
             await self._delay_before(delay=delay_before, debug=debug)
             
             # _wait_until part
             if waitUntilCond is not None:
-                fut = asyncio.get_running_loop().create_future()
-                await self._wait_until(waitUntilCond, fut)
-                done = await asyncio.wait_for(fut, timeout=waitUntil_timeout)
+                await self._await_cond(waitUntilCond, waitUntil_timeout)
             s = await self._cmd_send(command)
-            
-            if delay_after is not None:
-                if self.debug:
-                    print(f"DELAY_AFTER / {C.WARNING}{self.name} "
-                          f"{C.WARNING} WAITING FOR {delay_after}... "
-                          f"{C.BOLD}{C.OKBLUE}START{C.ENDC}"
-                          )
-                await sleep(delay_after)
-                if self.debug:
-                    print(f"DELAY_AFTER / {C.WARNING}{self.name} "
-                          f"{C.WARNING} WAITING FOR {delay_after}... "
-                          f"{C.BOLD}{C.OKGREEN}DONE{C.ENDC}"
-                          )
-            
-            self.port_free_condition.notify_all()
+        except BaseException:
+            # the command did not go out: no answer will free the port, so open the gate again
+            self._release_port()
+            raise
+        
+        if delay_after:
+            if self.debug:
+                print(_DELAY_AFTER_START.format(name=self.name, delay=delay_after))
+            await sleep(delay_after)
+            if self.debug:
+                print(_DELAY_AFTER_DONE.format(name=self.name, delay=delay_after))
+        
         return s
     
     async def _cmd_send(self, cmd: DOWNSTREAM_MESSAGE) -> bool:
@@ -717,10 +750,14 @@ class ADevice(ABC):
 
         """
         try:
-            self.connection[1].write(cmd.COMMAND[:2])
-            await self.connection[1].drain()
-            self.connection[1].write(cmd.COMMAND[1:])
-            await self.connection[1].drain()  # cmd sent
+            writer = self.connection[1]
+            command = memoryview(cmd.COMMAND)
+            # carrier (handle, length) and message go out as one buffer: a single write and a single drain;
+            # the memoryview slices are zero-copy, the join is the only allocation
+            writer.write(b''.join((command[:2], command[1:])))
+            # the socket usually takes the whole buffer right away; only suspend for back-pressure or a dying link
+            if writer.transport.is_closing() or writer.transport.get_write_buffer_size():
+                await writer.drain()  # cmd sent
         except (
                 AttributeError, ConnectionRefusedError, ConnectionAbortedError,
                 ConnectionResetError, ConnectionError) as ce:
@@ -772,8 +809,9 @@ class ADevice(ABC):
         else:
             try:
                 answer = await self._connect_srv()
-                debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: RECEIVED CON_REQ ANSWER: {answer.hex()}",
-                           debug=self.debug)
+                if self.debug:
+                    debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: RECEIVED CON_REQ ANSWER: {answer.hex()}",
+                               debug=self.debug)
                 
                 await self._dispatch_return_data(data=answer)
                 await self.ext_srv_connected.wait()
@@ -801,14 +839,16 @@ class ADevice(ABC):
         
         for _ in range(1, 3):
             current_command = CMD_EXT_SRV_CONNECT_REQ(port=self.port)
-            debug_info(
-                    f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: "
-                    f"{current_command.COMMAND.hex()}",
-                    debug=self.debug)
+            if self.debug:
+                debug_info(
+                        f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: "
+                        f"{current_command.COMMAND.hex()}",
+                        debug=self.debug)
             s = await self._cmd_send(current_command)
             if not s:
-                debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: failed... retrying",
-                           debug=self.debug)
+                if self.debug:
+                    debug_info(f"[{self.name}:{self.port[0]}]-[MSG]: Sending CMD_EXT_SRV_CONNECT_REQ: failed... retrying",
+                               debug=self.debug)
                 continue
             else:
                 break
@@ -830,22 +870,27 @@ class ADevice(ABC):
             Flag indicating state of listener (TRUE:listening/FAlSE: not listening).
         
         """
-        await self.ext_srv_connected.wait()
-        debug_info(
-            f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]: LISTENING ON SOCKET [{self.socket}]...{C.ENDC}",
-            debug=self.debug)
-        while self.ext_srv_connected.is_set():
+        ext_srv_connected = self.ext_srv_connected
+        await ext_srv_connected.wait()
+        if self.debug:
+            debug_info(
+                f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]: LISTENING ON SOCKET [{self.socket}]...{C.ENDC}",
+                debug=self.debug)
+        # the reader and the message tag do not change while connected, look them up once per connection
+        reader = self.connection[0]
+        tag = f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]"
+        connected = ext_srv_connected.is_set
+        while connected():
             try:
-                bytes_to_read = await self.connection[0].readexactly(n=1)
-                debug_info(
-                    f"{C.BOLD}{C.OKBLUE}[{self.name}:{self.port[0]}]-[MSG]: reading {bytes_to_read} / "
-                    f"{bytes_to_read[0]}]...{C.ENDC}",
-                    debug=self.debug)
-                data = bytearray(await self.connection[0].readexactly(n=bytes_to_read[0]))
+                bytes_to_read = await reader.readexactly(n=1)
+                if self.debug:
+                    debug_info(f"{tag}: reading {bytes_to_read} / {bytes_to_read[0]}]...{C.ENDC}", debug=True)
+                data = bytearray(await reader.readexactly(n=bytes_to_read[0]))
             except (ConnectionError, IOError) as e:
-                self.ext_srv_connected.clear()
+                ext_srv_connected.clear()
                 self.ext_srv_disconnected.set()
-                debug_info(f"CONNECTION LOST... {e.args}", debug=self.debug)
+                if self.debug:
+                    debug_info(f"CONNECTION LOST... {e.args}", debug=self.debug)
                 return False
             else:
                 try:
@@ -853,10 +898,12 @@ class ADevice(ABC):
                 except TypeError as te:
                     raise TypeError(f"[{self.name}:{self.port[0]}]-[ERR]: Dispatching received data failed... "
                                     f"Aborting")
-            await asyncio.sleep(.001)
+            # readexactly already parks until data arrives; only yield so a full buffer cannot starve other tasks
+            await asyncio.sleep(0)
         
-        debug_info(f"{C.BOLD}{C.OKBLUE}[{self.server[0]}:{self.server[1]}]-[MSG]: CONNECTION CLOSED...{C.ENDC}",
-                   debug=self.debug)
+        if self.debug:
+            debug_info(f"{C.BOLD}{C.OKBLUE}[{self.server[0]}:{self.server[1]}]-[MSG]: CONNECTION CLOSED...{C.ENDC}",
+                       debug=self.debug)
         return False
     
     async def _dispatch_return_data(self, data: bytearray) -> bool:
@@ -869,25 +916,16 @@ class ADevice(ABC):
             (bool): Flag indicating Success/Failure.
             
         """
-        RETURN_MESSAGE = UpStreamMessageBuilder(data, debug=True).dispatch()
-        if RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD:
+        RETURN_MESSAGE = UpStreamMessageBuilder(data, debug=self.debug).dispatch()
+        m_type = RETURN_MESSAGE.m_header.m_type
+        if m_type == MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD:
             await self.ext_srv_notification_set(RETURN_MESSAGE, debug=self.debug)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_VALUE:
-            await self.port_value_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK:
-            await self.cmd_feedback_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR:
-            await self.error_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_PORT_NOTIFICATION:
-            await self.port_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_HUB_ATTACHED_IO:
-            await self.hub_attached_io_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ACTION:
-            await self.hub_action_notification_set(RETURN_MESSAGE)
-        elif RETURN_MESSAGE.m_header.m_type == MESSAGE_TYPE.UPS_DNS_HUB_ALERT:
-            await self.hub_alert_notification_set(RETURN_MESSAGE)
-        else:
+            return True
+        # one table lookup instead of comparing the type against every message type in turn
+        setter = _RETURN_DATA_SETTERS.get(m_type[0])
+        if setter is None:
             raise TypeError(f"[{self.name}:{self.port}]-[ERR] Cannot dispatch CMD-ANSWER FROM DEVICE: {data.hex()}...")
+        await getattr(self, setter)(RETURN_MESSAGE)
         return True
     
     @property
@@ -953,7 +991,7 @@ class ADevice(ABC):
     
     @property
     @abstractmethod
-    def error_notification_log(self) -> List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
+    def error_notification_log(self) -> Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
         """Contains all notifications for Lego-Hub-Errors.
 
         :return: The list of ERROR-Notifications
@@ -1050,31 +1088,123 @@ class ADevice(ABC):
     
     @property
     @abstractmethod
-    def cmd_feedback_log(self) -> List[Tuple[float, PORT_CMD_FEEDBACK]]:
+    def cmd_feedback_log(self) -> Deque[Tuple[float, PORT_CMD_FEEDBACK]]:
         """A log of all past Command Feedback Messages.
         
         Returns
         -------
-        List[tuple[float, PORT_CMD_FEEDBACK]]
+        Deque[Tuple[float, PORT_CMD_FEEDBACK]]
             the Log
         
         """
         raise NotImplementedError
     
-    async def _wait_until(self, cond: Callable, fut: Future):
+    async def _acquire_port(self) -> None:
+        """Wait at the port gate and mark the port as taken; counterpart of :meth:`_release_port`.
+
+        If the port is free and no other task holds :attr:`port_free_condition`, the check-and-clear runs
+        without an await and is therefore atomic; the lock is only entered when the caller has to queue.
+
+        This method is a coroutine.
+
+        """
+        port_free = self.port_free
+        if port_free.is_set() and not self.port_free_condition.locked():
+            port_free.clear()
+            return
+        async with self.port_free_condition:
+            if not port_free.is_set():
+                await port_free.wait()
+            port_free.clear()
+        return
+
+    def _release_port(self) -> None:
+        """Mark the port free and wake the tasks waiting at the port gate in one step.
+        
+        Tasks at the gate wait on :attr:`port_free`, so setting it is the wake-up; the call does not need
+        :attr:`port_free_condition` to be held.
+        
+        """
+        self.port_free.set()
+        return
+    
+    async def _wait_until(self, cond: Callable, fut: Future, timeout: Optional[float] = None):
+        # the timeout is checked between polls, so no wrapper task or extra timer is needed to enforce it
+        now = asyncio.get_running_loop().time
+        deadline = None if timeout is None else now() + timeout
         while True:
             if cond():
                 fut.set_result(True)
                 return
+            if (deadline is not None) and (now() >= deadline):
+                fut.set_result(False)  # deemed met, see _await_cond
+                return
             await asyncio.sleep(0.001)
     
-    async def _on_wait_cond_do(self, wait_cond: Union[Awaitable, Callable] = None) -> bool:
+    async def _await_cond(self, cond: Callable, timeout: Optional[float] = None) -> bool:
+        """Wait until the condition `cond` is met.
+        
+        A coroutine function is awaited directly; a plain predicate is polled by :meth:`_wait_until`.
+        
+        Parameters
+        ----------
+        cond : Callable
+            The predicate or coroutine function to wait for.
+        timeout : float, optional
+            Give up after `timeout` seconds. ``None`` waits indefinitely.
+
+        Returns
+        -------
+        bool
+            The result of `cond`, ``False`` if `timeout` elapsed. As in :meth:`_on_wait_cond_do` an elapsed
+            timeout deems the condition met, the caller goes on with its command.
+            
+        """
+        # without a timeout the waiter is awaited as is, wait_for would only add its timeout machinery
+        if asyncio.iscoroutinefunction(cond):
+            if timeout is None:
+                return await cond()
+            try:
+                return await asyncio.wait_for(cond(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+        fut = asyncio.get_running_loop().create_future()
+        await self._wait_until(cond, fut, timeout)
+        return fut.result()
+    
+    async def _on_wait_cond_do(self,
+                               wait_cond: Union[Awaitable, Callable] = None,
+                               timeout: Optional[float] = None,
+                               ) -> bool:
+        """Evaluate the wait condition of a command.
+        
+        Parameters
+        ----------
+        wait_cond : Union[Awaitable, Callable]
+            The condition to wait for. A Callable returning an Awaitable, e.g., a coroutine function, is awaited.
+        timeout : float, optional
+            Give up waiting for an awaitable `wait_cond` after `timeout` seconds. ``None`` waits indefinitely.
+            
+        Returns
+        -------
+        bool
+            The result of `wait_cond`, ``False`` if `timeout` elapsed.
+            
+        """
         result: bool = False
         if wait_cond:
             if isinstance(wait_cond, Callable):
-                result = wait_cond()
-            elif isinstance(wait_cond, Awaitable):
-                result = await wait_cond
+                # evaluated inline: a plain predicate never reaches the event loop
+                wait_cond = wait_cond()
+                if not isinstance(wait_cond, Awaitable):
+                    return wait_cond
+            if isinstance(wait_cond, Awaitable):
+                if timeout is None:
+                    return await wait_cond
+                try:
+                    result = await asyncio.wait_for(wait_cond, timeout=timeout)
+                except asyncio.TimeoutError:
+                    result = False
             else:
                 raise TypeError(f"{wait_cond} is neither of type Awaitable nor Callable...")
         return result
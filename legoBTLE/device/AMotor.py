@@ -8,14 +8,18 @@ The abstract :class:`AMotor` baseclass models common functions of a motor.
 
 """
 import asyncio
+import struct
 from abc import abstractmethod
 from asyncio import CancelledError, Task
 from asyncio import Event
 from asyncio import sleep
 from collections import defaultdict
+from contextlib import asynccontextmanager
+from copy import copy
 from time import monotonic
 from typing import Awaitable
 from typing import Callable
+from typing import Dict
 from typing import Optional
 from typing import Tuple
 from typing import Union
@@ -24,6 +28,8 @@ import numpy as np
 from colorama import Fore, Style
 
 from legoBTLE.device.ADevice import ADevice
+from legoBTLE.device.ADevice import _DELAY_AFTER_DONE
+from legoBTLE.device.ADevice import _DELAY_AFTER_START
 from legoBTLE.legoWP.message.downstream import CMD_GOTO_ABS_POS_DEV
 from legoBTLE.legoWP.message.downstream import CMD_MODE_DATA_DIRECT
 from legoBTLE.legoWP.message.downstream import CMD_SET_ACC_DEACC_PROFILE
@@ -31,6 +37,7 @@ from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_DEGREES
 from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_TIME
 from legoBTLE.legoWP.message.downstream import CMD_START_PWR_DEV
 from legoBTLE.legoWP.message.downstream import CMD_START_SPEED_DEV
+from legoBTLE.legoWP.message.upstream import PORT_VALUE
 from legoBTLE.legoWP.types import C
 from legoBTLE.legoWP.types import DIRECTIONAL_VALUE
 from legoBTLE.legoWP.types import MOVEMENT
@@ -43,6 +50,30 @@ from legoBTLE.networking.prettyprint.debug import debug_info_end
 from legoBTLE.networking.prettyprint.debug import debug_info_footer
 from legoBTLE.networking.prettyprint.debug import debug_info_header
 
+_GATES_WAITING = f"{{op}} +*+ <{{name}}: {{port}}>: AT THE GATES: {C.WARNING}WAITING"
+_GATES_PASSED = f"{{op}} +*+ <{{name}}: {{port}}>: AT THE GATES: {C.WARNING}PASSED"
+_POSITION = struct.Struct('<i')  # the int32 position field at the end of a SET_POSITION command
+
+
+def _sign(value) -> int:
+    """Sign of a scalar as -1, 0 or 1, same as ``int(np.sign(value))`` but without a ufunc call per command.
+    
+    ``value`` is converted to ``float`` first: numpy scalars (e.g., the ``np.floor`` result START_MOVE_DISTANCE hands
+    down) compare to ``numpy.bool_``, which cannot be subtracted.
+    """
+    value = float(value)
+    return (value > 0) - (value < 0)
+
+
+class _AccDecProfile:
+    """The acceleration and deceleration commands saved under one profile number."""
+    
+    __slots__ = ('acc', 'dec')
+    
+    def __init__(self):
+        self.acc: Optional[CMD_SET_ACC_DEACC_PROFILE] = None
+        self.dec: Optional[CMD_SET_ACC_DEACC_PROFILE] = None
+
 
 class AMotor(ADevice):
     """AMotor Class
@@ -55,8 +86,21 @@ class AMotor(ADevice):
     :func:`SET_ACC_PROFILE` : bool
         Set the acceleration profile for a motor.
     
+    Attributes
+    ----------
+    
+    STALL_MIN_POLL_INTERVAL : float, default 0.01
+        The shortest stall detection window in seconds. Smaller `time_to_stalled` values are raised to it, so that
+        the stall guard does not keep the event loop busy with sub-millisecond windows.
+    
     """
     
+    __slots__ = ()
+    
+    STALL_MIN_POLL_INTERVAL: float = 0.01
+    
+    _create_task = staticmethod(asyncio.create_task)
+    
     @property
     @abstractmethod
     def time_to_stalled(self) -> float:
@@ -116,12 +160,14 @@ class AMotor(ADevice):
             The current value of the motor in the specified unit (currently DEG or RAD) scaled by the gear_ratio.
             
         """
-        if si == SI.DEG:
-            if self.port_value is not None:
-                return self.port_value.m_port_value_DEG / self.gear_ratio
-        elif si == SI.RAD:
-            if self.port_value is not None:
-                return self.port_value.m_port_value_RAD / self.gear_ratio
+        value = self.port_value
+        cache = self._angle_cache
+        if (cache[0] is value) and (cache[1] == si):
+            return cache[2]
+        angle = self._scaled_angle(value, si)
+        if angle is not None:
+            self._angle_cache = (value, si, angle)
+        return angle
     
     def last_angle(self, si: SI = SI.DEG) -> float:
         """The last recorded motor angle.
@@ -137,12 +183,41 @@ class AMotor(ADevice):
             The last recorded angle in units si scaled by the gear_ratio.
             
         """
+        value = self.last_value
+        cache = self._last_angle_cache
+        if (cache[0] is value) and (cache[1] == si):
+            return cache[2]
+        angle = self._scaled_angle(value, si)
+        if angle is not None:
+            self._last_angle_cache = (value, si, angle)
+        return angle
+    
+    def _scaled_angle(self, value: PORT_VALUE, si: SI) -> Optional[float]:
+        """Scale a port value by the `gear_ratio` in the unit `si`.
+        
+        Every notification delivers a fresh :class:`PORT_VALUE`, so the identity of the value serves as the
+        version key of the `_angle_cache` / `_last_angle_cache` tuples ``(value, si, angle)``.
+        
+        Parameters
+        ----------
+        value : PORT_VALUE
+            The port value to scale.
+        si : SI
+            Specifies the unit of the return value.
+
+        Returns
+        -------
+        Optional[float]
+            The scaled angle, or None if `value` is None or `si` is neither DEG nor RAD.
+            
+        """
+        if value is None:
+            return None
         if si == SI.DEG:
-            if self.last_value is not None:
-                return self.last_value.m_port_value_DEG / self.gear_ratio
+            return value.m_port_value_DEG / self.gear_ratio
         elif si == SI.RAD:
-            if self.last_value is not None:
-                return self.last_value.m_port_value_RAD / self.gear_ratio
+            return value.m_port_value_RAD / self.gear_ratio
+        return None
     
     @property
     @abstractmethod
@@ -216,13 +291,14 @@ class AMotor(ADevice):
                                     debug: Optional[bool] = None,
                                     ) -> Task:
         _debug = self.debug if debug is None else debug
-        task: Task = asyncio.create_task(self._stall_detection(debug=True))
-        debug_info_header(f"[{cmd_id}]-[MSG]", debug=_debug)
+        task: Task = self._create_task(self._stall_detection(debug=_debug))
+        if _debug:
+            debug_info_header(f"[{cmd_id}]-[MSG]", debug=_debug)
         
-        debug_info(f"Task: {task} -> STALL_DETECTION READY", debug=_debug)
-        debug_info(
-            f"ON_STALLED_ACTION:\t{self.ON_STALLED_ACTION.__name__ if self.ON_STALLED_ACTION is not None else f'{Fore.RED}NOT SET'}",
-            debug=_debug)
+            debug_info(f"Task: {task} -> STALL_DETECTION READY", debug=_debug)
+            debug_info(
+                f"ON_STALLED_ACTION:\t{self.ON_STALLED_ACTION.__name__ if self.ON_STALLED_ACTION is not None else f'{Fore.RED}NOT SET'}",
+                debug=_debug)
         self.stall_guard = task
         return self.stall_guard
     
@@ -231,44 +307,88 @@ class AMotor(ADevice):
                                ) -> bool:
         debug = self.debug if debug is None else debug
         
+        # the events live as long as the motor, bind them once for the whole guard
+        e_cmd_started = self.E_CMD_STARTED
+        e_cmd_finished = self.E_CMD_FINISHED
+        e_port_value_rcv = self._e_port_value_rcv
+        e_motor_stalled = self.E_MOTOR_STALLED
+        loop = asyncio.get_running_loop()
+        _now = loop.time  # the clock call_later schedules its timers on
+        _call_later = loop.call_later
+        window_closed = False
+        
+        def _close_window():
+            nonlocal window_closed
+            window_closed = True
+            e_port_value_rcv.set()  # wake the window like a port value notification would
+        
+        if debug:
+            _dbg_prefix = f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}"
+        
         try:
             while True:
-                await self.E_CMD_STARTED.wait()  # await command start in cmd_feedback_notification
-                await self._e_port_value_rcv.wait()  # await motor data is actually coming in
-                self.E_MOTOR_STALLED.clear()
-                if self.time_to_stalled is not None:  # is time after which motor is deemed stalled defined
+                await e_cmd_started.wait()  # await command start in cmd_feedback_notification
+                await e_port_value_rcv.wait()  # await motor data is actually coming in
+                e_motor_stalled.clear()
+                time_to_stalled = self._cmd_time_to_stalled  # the stall time of the running command
+                if time_to_stalled is not None:  # is time after which motor is deemed stalled defined
+                    if time_to_stalled < self.STALL_MIN_POLL_INTERVAL:
+                        time_to_stalled = self.STALL_MIN_POLL_INTERVAL
                     
+                    stall_bias = self.stall_bias
                     m0: float = self.port_value.m_port_value_DEG
-                    await asyncio.sleep(self.time_to_stalled)  # wait stall time
+                    t0 = _now()
+                    delta = 0.0
+                    # woken by port value notifications instead of sleeping through the window: the window ends
+                    # early as soon as the motor has moved by stall_bias, a single timer closes it if it has not
+                    window_closed = False
+                    window = _call_later(time_to_stalled, _close_window)
+                    try:
+                        while True:
+                            e_port_value_rcv.clear()
+                            await e_port_value_rcv.wait()
+                            if window_closed:
+                                e_port_value_rcv.clear()  # set by the timer, not by a port value
+                                break
+                            delta = abs(self.port_value.m_port_value_DEG - m0)
+                            if delta >= stall_bias:
+                                break
+                    finally:
+                        window.cancel()
+                    dt = _now() - t0
+                    if e_cmd_finished.is_set():
+                        continue  # the command ended during the window: a motor at rest is not stalled
                     
-                    delta = abs(self.port_value.m_port_value_DEG - m0)
+                    self.avg_speed = delta / dt if dt > 0 else 0.0
+                    if debug:
+                        debug_info(f"{_dbg_prefix}]:\r\n"
+                                   f"DELTA_DEG:  {delta}\tDELTA_T:  {dt}\tv:\'(°/s):  "
+                                   f"{self.avg_speed}\tv_max\'(°/s):  {self.max_avg_speed}", debug=debug)
                     
-                    self.avg_speed = delta / self.time_to_stalled
-                    debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}]:\r\n"
-                               f"DELTA_DEG:  {delta}\tDELTA_T:  {self.time_to_stalled}\tv:\'(°/s):  "
-                               f"{self.avg_speed}\tv_max\'(°/s):  {self.max_avg_speed}", debug=debug)
-                    
-                    if delta < self.stall_bias:  # stall_bias will have a value in any case
-                        debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: "
-                                   f"{delta}  < {self.stall_bias}\t\t\t{C.FAIL}{C.BOLD}STALLED STALLED STALLED{C.ENDC}",
-                                   debug=debug)
-                        self.E_MOTOR_STALLED.set()  # motor is stalled now
-                        
-                        if self.ON_STALLED_ACTION is not None:  # is an action set for the case we stall
-                            debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}] >>> CALLING {C.FAIL} "
-                                       f"{self.ON_STALLED_ACTION}", debug=debug)
-                            result = await self.ON_STALLED_ACTION()
-                            debug_info(f"{self._stall_detection.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}] >>> CALLING {C.FAIL} "
-                                       f"succeeded with result {result}",
+                    if delta < stall_bias:  # stall_bias will have a value in any case
+                        if debug:
+                            debug_info(f"{_dbg_prefix}>: "
+                                       f"{delta}  < {stall_bias}\t\t\t{C.FAIL}{C.BOLD}STALLED STALLED STALLED{C.ENDC}",
                                        debug=debug)
+                        e_motor_stalled.set()  # motor is stalled now
+                        
+                        on_stalled_action = self.ON_STALLED_ACTION
+                        if on_stalled_action is not None:  # is an action set for the case we stall
+                            if debug:
+                                debug_info(f"{_dbg_prefix}] >>> CALLING {C.FAIL} {on_stalled_action}", debug=debug)
+                            result = await on_stalled_action()
+                            if debug:
+                                debug_info(f"{_dbg_prefix}] >>> CALLING {C.FAIL} succeeded with result {result}",
+                                           debug=debug)
                             del self.ON_STALLED_ACTION  # action on stalled can only be used once, motor can't move anymore
-                            self._e_port_value_rcv.clear()
+                            e_port_value_rcv.clear()
                 
-                else:  # user doesn't want any stall detection
-                    await asyncio.sleep(0.001)
+                else:  # user doesn't want any stall detection for this command: park until it has finished
+                    await e_cmd_finished.wait()
         
         except CancelledError as stall_detection_shutdown:
-            debug_info(f"{Style.BRIGHT}{Fore.BLUE}{12 * '*'}{Style.NORMAL} {self._stall_detection.__name__}", debug=debug)
+            if debug:
+                debug_info(f"{Style.BRIGHT}{Fore.BLUE}{12 * '*'}{Style.NORMAL} {self._stall_detection.__name__}", debug=debug)
         
         return True
     
@@ -348,19 +468,19 @@ class AMotor(ADevice):
     
     @property
     @abstractmethod
-    def acc_dec_profiles(self) -> defaultdict:
-        """acc_dec_profiles
+    def acc_dec_profiles(self) -> Dict[int, _AccDecProfile]:
+        """The acc/dec profiles defined so far, by profile number.
         
         Returns
         -------
-        defaultdict
+        Dict[int, _AccDecProfile]
 
         """
         raise NotImplementedError
     
     @acc_dec_profiles.setter
     @abstractmethod
-    def acc_dec_profiles(self, profile: defaultdict):
+    def acc_dec_profiles(self, profile: Dict[int, _AccDecProfile]):
         raise NotImplementedError
     
     @property
@@ -390,6 +510,196 @@ class AMotor(ADevice):
     def clockwise_direction(self, real_clockwise_direction):
         raise NotImplementedError
     
+    def _acc_dec_profile(self, profile_nr: int) -> _AccDecProfile:
+        """Return the profile saved under `profile_nr`, adding an empty one if there is none yet.
+        
+        Parameters
+        ----------
+        profile_nr : int
+            The profile number.
+
+        Returns
+        -------
+        _AccDecProfile
+            The acc/dec commands saved under `profile_nr`.
+            
+        """
+        profiles = self.acc_dec_profiles
+        profile = profiles.get(profile_nr)
+        if profile is None:
+            profile = profiles[profile_nr] = _AccDecProfile()
+        return profile
+    
+    def _acc_dec_command(self,
+                         stored: Optional[CMD_SET_ACC_DEACC_PROFILE],
+                         profile_type: bytes,
+                         ms: int,
+                         profile_nr: int,
+                         ) -> CMD_SET_ACC_DEACC_PROFILE:
+        """Return the acc/dec profile command for `ms` and `profile_nr`.
+        
+        A `stored` command for the same time and port is sent again as is; only a changed profile builds a new
+        command.
+        
+        Parameters
+        ----------
+        stored : CMD_SET_ACC_DEACC_PROFILE, optional
+            The command currently saved for this profile number and kind.
+        profile_type : bytes
+            The matching sub command, i.e., SUB_COMMAND.SET_ACC_PROFILE or SUB_COMMAND.SET_DEACC_PROFILE.
+        ms : int
+            Time to reach full speed or come to a halt.
+        profile_nr : int
+            The profile number.
+
+        Returns
+        -------
+        CMD_SET_ACC_DEACC_PROFILE
+            The command.
+            
+        """
+        if (stored is not None) and (stored.time_to_full_zero_speed == ms) and (stored.port == self.port):
+            return stored
+        return CMD_SET_ACC_DEACC_PROFILE(
+                profile_type=profile_type,
+                port=self.port,
+                start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                time_to_full_zero_speed=ms,
+                profile_nr=profile_nr,
+                )
+    
+    @asynccontextmanager
+    async def _port_gate(self,
+                         op: str,
+                         delay_before: float = None,
+                         delay_after: float = None,
+                         debug: bool = False,
+                         ):
+        """Hold the port gate around the body of a motor command.
+        
+        Waits at the gate until the port is free, applies `delay_before`, runs the body and applies `delay_after`
+        once the body has completed. The port is not released on leaving the block, this is left to the command
+        feedback (or to the body itself if it gives up before sending).
+        
+        Parameters
+        ----------
+        op : str
+            The command name used in the debug messages.
+        delay_before : float, optional
+            Seconds to wait after passing the gate.
+        delay_after : float, optional
+            Seconds to wait after the body completed.
+        debug : bool
+            If ``True`` debug messages will be printed, ``False`` otherwise.
+        
+        """
+        if debug:
+            debug_info_begin(_GATES_WAITING.format(op=op, name=self.name, port=self.port[0]), debug=debug)
+        
+        await self._acquire_port()
+        
+        if debug:
+            debug_info_end(_GATES_PASSED.format(op=op, name=self.name, port=self.port[0]), debug=debug)
+        
+        await self._delay_before(delay_before, when='b', cmd_id=op, debug=debug)
+        
+        yield
+        
+        if delay_after:
+            if debug:
+                debug_info_begin(_DELAY_AFTER_START.format(name=self.name, delay=delay_after), debug=debug)
+            await sleep(delay_after)
+            if debug:
+                debug_info_end(_DELAY_AFTER_DONE.format(name=self.name, delay=delay_after), debug=debug)
+    
+    async def _set_profile(self,
+                           kind: str,
+                           ms: int,
+                           profile_nr: int,
+                           wait_cond: Union[Awaitable, Callable] = None,
+                           wait_cond_timeout: float = None,
+                           delay_before: float = None,
+                           delay_after: float = None,
+                           debug: Optional[bool] = None,
+                           ) -> bool:
+        """Common body of :func:`SET_ACC_PROFILE` and :func:`SET_DEC_PROFILE`.
+
+        Parameters
+        ----------
+        kind : str
+            Either ``'ACC'`` or ``'DEC'``, selects the profile half, the sub command and the
+            :attr:`current_profile` key.
+        ms : int
+            Time to full speed (``'ACC'``) or to zero speed (``'DEC'``). A negative value reuses the saved profile.
+
+        Returns
+        -------
+        bool
+            True if everything was OK, False otherwise.
+
+        """
+        debug = self.debug if debug is None else debug
+        op = f"SET_{kind}_PROFILE"
+        attr = kind.lower()
+        profile_type = SUB_COMMAND.SET_ACC_PROFILE if kind == 'ACC' else SUB_COMMAND.SET_DEACC_PROFILE
+        
+        profile = self.acc_dec_profiles.get(profile_nr)
+        command = self._acc_dec_command(None if profile is None else getattr(profile, attr),
+                                        profile_type,
+                                        ms,
+                                        profile_nr)
+        
+        if debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, debug):
+            if not ms >= 0:
+                if (profile is None) or (getattr(profile, attr) is None):
+                    self._release_port()
+                    if debug:
+                        debug_info(
+                                f"COMMAND {op}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: No speed setting given, tied to find already saved profile - FAILED",
+                                debug=debug)
+                        debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
+                    raise KeyError(f"{op} {profile_nr} not found...")
+                command = getattr(profile, attr)
+            else:
+                try:
+                    if profile is None:
+                        profile = self._acc_dec_profile(profile_nr)
+                    setattr(profile, attr, command)
+                    self.current_profile[kind] = (profile_nr, command)
+                except TypeError as te:
+                    self._release_port()
+                    if debug:
+                        debug_info(
+                                f"COMMAND {op}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: SAVING PROFILE - FAILED",
+                                debug=debug)
+                        debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
+                    raise TypeError(f"{op} {type(profile_nr)} wrong... {te.args}")
+            
+            # _wait_until part
+            if wait_cond:
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
+            
+            if debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=debug)
+            s = await self._cmd_send(command)
+            # await self.E_CMD_STARTED.wait()
+            
+            _t0 = monotonic()
+            if debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=debug)
+            await self.E_CMD_FINISHED.wait()
+            if debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - _t0}s",
+                               debug=debug)
+        
+        if debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
+        return s
+    
     async def SET_DEC_PROFILE(self,
                               ms_to_zero_speed: int,
                               profile_nr: int,
@@ -438,118 +748,13 @@ class AMotor(ADevice):
             The counter-part of this method, i.e., controlling the acceleration.
         
         """
-        _wcd = None
-        debug = self.debug if debug is None else debug
-        
-        command = CMD_SET_ACC_DEACC_PROFILE(
-                profile_type=SUB_COMMAND.SET_DEACC_PROFILE,
-                port=self.port,
-                start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
-                completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
-                time_to_full_zero_speed=ms_to_zero_speed,
-                profile_nr=profile_nr,
-                )
-        
-        debug_info_header(f"COMMAND {self.SET_DEC_PROFILE.__name__}:<{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(
-                f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                debug=debug)
-        async with self.port_free_condition:
-            
-            debug_info_begin(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                    debug=debug)
-            
-            await self.port_free.wait()
-            
-            debug_info_end(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                    debug=debug)
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT",
-                       debug=debug)
-            
-            self.port_free.clear()
-            
-            if delay_before:
-                debug_info_begin(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [send_cmd({command.COMMAND.hex()}) for: {delay_before}-T0]",
-                        debug=debug)
-                
-                await sleep(delay_before)
-                
-                debug_info_end(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [send_cmd({command.COMMAND.hex()}) for: {delay_before}-T0]",
-                        debug=debug)
-            
-            if not ms_to_zero_speed >= 0:
-                try:
-                    command = self.acc_dec_profiles[profile_nr]['DEC']
-                except (TypeError, KeyError) as ke:
-                    self.port_free.set()
-                    self.port_free_condition.notify_all()
-                    debug_info(
-                            f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: No speed setting given, tied to find already saved profile - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
-                    raise Exception(f"SET_DEC_PROFILE {profile_nr} not found... {ke.args}")
-            else:
-                try:
-                    self.acc_dec_profiles[profile_nr]['DEC'] = command
-                    self.current_profile['DEC'] = (profile_nr, command)
-                except TypeError as te:
-                    self.port_free.set()
-                    self.port_free_condition.notify_all()
-                    debug_info(
-                            f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: SAVING PROFILE - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_DEC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
-                    raise TypeError(f"SET_DEC_PROFILE {type(profile_nr)} wrong... {te.args}")
-            
-            debug_info_begin(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    SENDING CMD",
-                             debug=debug)
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}",
-                       debug=debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-            
-            s = await self._cmd_send(command)
-            # await self.E_CMD_STARTED.wait()
-            
-            debug_info_end(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    CMD SENT",
-                           debug=debug)
-            
-            _t0 = monotonic()
-            debug_info(f"{self.SET_DEC_PROFILE.__name__} +*+ MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITED -- t0={_t0}s", debug=debug)
-            
-            await self.E_CMD_FINISHED.wait()
-            
-            _t0 = monotonic()
-            if delay_after:
-                debug_info_begin(
-                        f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [return from method] for: {delay_before}-T0",
-                        debug=debug)
-                
-                await sleep(delay_after)
-                
-                debug_info_end(
-                    f"{self.SET_DEC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying [return from method] for: dt={monotonic() - _t0}s",
-                    debug=debug)
-            
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
-            self.port_free_condition.notify_all()
-        debug_info_footer(f"{self.SET_DEC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>",
-                          debug=debug)
-        self.no_exec = False
-        return s
+        return await self._set_profile('DEC', ms_to_zero_speed, profile_nr,
+                                       wait_cond=wait_cond,
+                                       wait_cond_timeout=wait_cond_timeout,
+                                       delay_before=delay_before,
+                                       delay_after=delay_after,
+                                       debug=debug,
+                                       )
     
     async def SET_ACC_PROFILE(self,
                               ms_to_full_speed: int,
@@ -594,118 +799,13 @@ class AMotor(ADevice):
         :class:`legoBTLE.device.AMotor.AMotor.SET_DEC_PROFILE` : The counter-part of this method, i.e., controlling the acceleration.
         
         """
-        debug = self.debug if debug is None else debug
-        _wcd = None
-
-        command = CMD_SET_ACC_DEACC_PROFILE(
-                profile_type=SUB_COMMAND.SET_ACC_PROFILE,
-                port=self.port,
-                start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
-                completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
-                time_to_full_zero_speed=ms_to_full_speed,
-                profile_nr=profile_nr,
-                )
-        
-        debug_info_header(f"COMMAND {self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(
-                f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                debug=debug)
-        
-        async with self.port_free_condition:
-            
-            debug_info_begin(
-                    f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                    debug=debug)
-            
-            await self.port_free.wait()
-            
-            debug_info_end(
-                    f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                    debug=debug)
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT",
-                       debug=debug)
-            
-            self.port_free.clear()
-            
-            if delay_before:
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>",
-                        debug=debug)
-                
-                await sleep(delay_before)
-                
-                debug_info_end(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>",
-                        debug=debug)
-            
-            if not ms_to_full_speed >= 0:
-                try:
-                    command = self.acc_dec_profiles[profile_nr]['ACC']
-                except (TypeError, KeyError) as ke:
-                    self.port_free.set()
-                    self.port_free_condition.notify_all()
-                    
-                    debug_info(
-                            f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: No speed setting given, tied to find already saved profile - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
-                    raise Exception(f"SET_ACC_PROFILE {profile_nr} not found... {ke.args}")
-            else:
-                try:
-                    self.acc_dec_profiles[profile_nr]['ACC'] = command
-                    self.current_profile['ACC'] = (profile_nr, command)
-                except TypeError as te:
-                    self.port_free.set()
-                    self.port_free_condition.notify_all()
-                    
-                    debug_info(
-                            f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>: {C.WARNING}EXCEPTION: SAVING PROFILE - FAILED",
-                            debug=debug)
-                    debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                                      debug=debug)
-                    raise TypeError(f"Profile id [tp_id] is {profile_nr}... {te.args}")
-            
-            debug_info_begin(f" {self.SET_ACC_PROFILE.__name__} +*+ <{self.name}: {self.port[0]}>:    SENDING CMD",
-                             debug=debug)
-            debug_info(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>:    CMD: {command}",
-                       debug=debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-            
-            s = await self._cmd_send(command)
-            debug_info_end(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>:    CMD SENT",
-                           debug=debug)
-            
-            # await self.E_CMD_STARTED.wait()
-            t0 = monotonic()
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITING -- t0={t0}s", debug=debug)
-            await self.E_CMD_FINISHED.wait()
-            debug_info(f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>:    COMMAND END:    {C.WARNING}"
-                       f"WAITED: dt={monotonic() - t0}s", debug=debug)
-            
-            if delay_after:
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying method return",
-                        debug=debug)
-                
-                await sleep(delay_after)
-                debug_info_begin(
-                        f"{self.SET_ACC_PROFILE.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: delaying method return",
-                        debug=debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
-            
-            self.port_free_condition.notify_all()
-        debug_info_footer(f"COMMAND {self.SET_ACC_PROFILE.__name__}: <{self.name}: {self.port[0]}>",
-                          debug=debug)
-        return s
+        return await self._set_profile('ACC', ms_to_full_speed, profile_nr,
+                                       wait_cond=wait_cond,
+                                       wait_cond_timeout=wait_cond_timeout,
+                                       delay_before=delay_before,
+                                       delay_after=delay_after,
+                                       debug=debug,
+                                       )
     
     async def START_MOVE_DISTANCE(self,
                                   distance: float,
@@ -827,78 +927,54 @@ class AMotor(ADevice):
         <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#output-sub-command-startpower-power>`_.
         
         """
-        _wcd = None
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
         power *= self.clockwise_direction  # normalize speed
         if isinstance(power, DIRECTIONAL_VALUE):
-            _power = power.value * int(np.sign(power.value)) * self.clockwise_direction
+            _power = power.value * _sign(power.value) * self.clockwise_direction
         else:
-            _power = power * int(np.sign(power)) * self.clockwise_direction
+            _power = power * _sign(power) * self.clockwise_direction
         
         debug = self.debug if debug is None else debug
-        command = CMD_START_PWR_DEV(
-                synced=False,
-                port=self.port,
-                power=_power,
-                start_cond=start_cond,
-                completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS
-                )
-        
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port} # {self.START_POWER_UNREGULATED.__name__}", debug=debug)
-        debug_info_begin(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # WAITING AT THE GATES",
-                         debug=debug)
-        async with self.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # PASSED THE GATES",
-                           debug=debug)
-            
-            if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_before {delay_before}s",
-                        debug=debug)
-                await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_before {delay_before}s",
-                        debug=debug)
-            
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # sending CMD", debug=debug)
+        port = self.port
+        # repeated commands with identical arguments reuse the previously built command
+        cmd_key = (port, _power, start_cond)
+        if (self._power_cmd is not None) and (self._power_cmd[0] == cmd_key):
+            command = self._power_cmd[1]
+        else:
+            command = CMD_START_PWR_DEV(
+                    synced=False,
+                    port=port,
+                    power=_power,
+                    start_cond=start_cond,
+                    completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS
+                    )
+            self._power_cmd = (cmd_key, command)
+        
+        op = 'START_POWER_UNREGULATED'
+        if debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, debug):
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
             
+            if debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=debug)
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
-            debug_info(f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # CMD: {command}",
-                       debug=debug)
-            debug_info_end(
-                    f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # sending CMD", debug=debug)
+            
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            if debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
-            
-            if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_after {delay_after}s",
-                        debug=debug)
-                await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port} / {self.START_POWER_UNREGULATED.__name__} # delay_after {delay_after}s",
-                        debug=debug)
+            if debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - t0}s", debug=debug)
         
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port} # {self.START_POWER_UNREGULATED.__name__}",
-                          debug=debug)
+        if debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
         return s
     
     async def START_SPEED_UNREGULATED(
@@ -958,8 +1034,7 @@ class AMotor(ADevice):
         for a complete command description.
         
         """
-        _wcd = None
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
         if isinstance(speed, DIRECTIONAL_VALUE):
@@ -968,64 +1043,48 @@ class AMotor(ADevice):
             _speed = speed * self.clockwise_direction  # normalize speed
         debug = self.debug if debug is None else debug
         
-        command = CMD_START_SPEED_DEV(
-                synced=False,
-                port=self.port,
-                start_cond=start_cond,
-                completion_cond=completion_cond,
-                speed=_speed,
-                abs_max_power=abs_max_power,
-                use_profile=use_profile,
-                use_acc_profile=use_acc_profile,
-                use_dec_profile=use_dec_profile)
-        
-        debug_info_header(f"{self.name}:{self.port}.START_SPEED_UNREGULATED()", debug=debug)
-        debug_info(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): AT THE GATES - WAITING", debug=debug)
-        async with self.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            
-            debug_info(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): AT THE GATES - PASSED", debug=debug)
-            if delay_before is not None:
-                debug_info_begin(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): delay_before",
-                                 debug=debug)
-                await sleep(delay_before)
-                debug_info_end(f"{self.name}:{self.port}.START_SPEED_UNREGULATED(): delay_before",
-                               debug=debug)
-            
+        port = self.port
+        # repeated commands with identical arguments reuse the previously built command
+        cmd_key = (port, start_cond, completion_cond, _speed, abs_max_power, use_profile, use_acc_profile,
+                   use_dec_profile)
+        if (self._speed_cmd is not None) and (self._speed_cmd[0] == cmd_key):
+            command = self._speed_cmd[1]
+        else:
+            command = CMD_START_SPEED_DEV(
+                    synced=False,
+                    port=port,
+                    start_cond=start_cond,
+                    completion_cond=completion_cond,
+                    speed=_speed,
+                    abs_max_power=abs_max_power,
+                    use_profile=use_profile,
+                    use_acc_profile=use_acc_profile,
+                    use_dec_profile=use_dec_profile)
+            self._speed_cmd = (cmd_key, command)
+        
+        op = 'START_SPEED_UNREGULATED'
+        if debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, debug):
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
             
+            if debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=debug)
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
+            
             t0 = monotonic()
-            debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
+            if debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
-            
-            if self.debug:
-                print(f"{self.name}.START_SPEED SENDING COMPLETE...")
-            
-            if delay_after is not None:
-                if self.debug:
-                    print(f"{C.WARNING}DELAY_AFTER / {self.name} "
-                          f"{C.WARNING}WAITING FOR {delay_after}... "
-                          f"{C.BOLD}{C.OKBLUE}START{C.ENDC}"
-                          )
-                await sleep(delay_after)
-                if self.debug:
-                    print(f"{C.WARNING}DELAY_AFTER / {self.name} "
-                          f"{C.WARNING}WAITING FOR {delay_after}... "
-                          f"{C.BOLD}{C.UNDERLINE}{C.OKBLUE}DONE{C.ENDC}"
-                          )
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
+            if debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - t0}s", debug=debug)
         
+        if debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
         return s
     
     async def GOTO_ABS_POS(
@@ -1082,10 +1141,9 @@ class AMotor(ADevice):
         wait_cond_timeout : float
 
         """
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
         
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value * self.clockwise_direction
@@ -1095,93 +1153,52 @@ class AMotor(ADevice):
         _gearRatio = self.gear_ratio
         _debug = self.debug if debug is None else debug
         
-        command = CMD_GOTO_ABS_POS_DEV(
-                synced=False,
-                port=self.port,
-                start_cond=start_cond,
-                completion_cond=completion_cond,
-                speed=_speed,
-                abs_pos=position,
-                gearRatio=_gearRatio,
-                abs_max_power=abs_max_power,
-                on_completion=on_completion,
-                use_profile=use_profile,
-                use_acc_profile=use_acc_profile,
-                use_dec_profile=use_dec_profile,
-                )
-        
-        debug_info_header(f"COMMAND {self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=_debug)
-        debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name}--{self.port[0]}>    AT THE GATES......{C.WARNING}WAITING",
-                debug=_debug)
-        
-        async with self.port_free_condition:
-            
-            debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    PORT_FREE.is_set()......{C.WARNING}WAITING",
-                debug=_debug)
-            
-            await self.port_free.wait()
-            
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    PORT_FREE.is_set()......{C.WARNING}SET",
-                    debug=_debug)
-            debug_info(f"CMD {self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    LOCKING PORT", debug=_debug)
-            
-            self.port_free.clear()
-            
-            debug_info_end(f"{self.GOTO_ABS_POS.__name__} +*+ <{self.name} -- {self.port[0]}>    AT THE GATES......{C.WARNING}PASSED",
-                           debug=_debug)
-            
-            if delay_before is not None:
-                debug_info_begin(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=_debug)
-                await sleep(delay_before)
-                debug_info_end(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=_debug)
-            
+        port = self.port
+        # repeated commands with identical arguments reuse the previously built command
+        cmd_key = (port, start_cond, completion_cond, _speed, position, _gearRatio, abs_max_power, on_completion,
+                   use_profile, use_acc_profile, use_dec_profile)
+        if (self._goto_cmd is not None) and (self._goto_cmd[0] == cmd_key):
+            command = self._goto_cmd[1]
+        else:
+            command = CMD_GOTO_ABS_POS_DEV(
+                    synced=False,
+                    port=port,
+                    start_cond=start_cond,
+                    completion_cond=completion_cond,
+                    speed=_speed,
+                    abs_pos=position,
+                    gearRatio=_gearRatio,
+                    abs_max_power=abs_max_power,
+                    on_completion=on_completion,
+                    use_profile=use_profile,
+                    use_acc_profile=use_acc_profile,
+                    use_dec_profile=use_dec_profile,
+                    )
+            self._goto_cmd = (cmd_key, command)
+        
+        op = 'GOTO_ABS_POS'
+        if _debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=_debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, _debug):
             # _wait_until part
-            if wait_cond is not None:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+            if wait_cond:
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
             
-            debug_info_begin(
-                f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}",
-                debug=_debug)
+            if _debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=_debug)
             s = await self._cmd_send(command)
-            
             await self.E_CMD_STARTED.wait()
-            t0 = monotonic()
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>     sending {command.COMMAND.hex()}",
-                    debug=_debug)
-            debug_info_begin(f"CMD {self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for "
-                             f"{command.COMMAND.hex()} to finish", debug=_debug)
             
+            t0 = monotonic()
+            if _debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=_debug)
             await self.E_CMD_FINISHED.wait()
-            
-            debug_info_end(
-                    f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for {command.COMMAND.hex()} to finish",
-                    debug=_debug)
-            
-            if delay_after is not None:
-                debug_info_begin(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}",
-                        debug=_debug)
-                await sleep(delay_after)
-                debug_info_end(
-                        f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>     delaying return from method for {delay_after}",
-                        debug=_debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-                    await _wcd
-            except (CancelledError, AttributeError):
-                pass
-            self.port_free_condition.notify_all()
-        debug_info_footer(f"{self.GOTO_ABS_POS.__name__} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=_debug)
+            if _debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - t0}s", debug=_debug)
+        
+        if _debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=_debug)
         return s
     
     async def STOP(self,
@@ -1214,40 +1231,89 @@ class AMotor(ADevice):
         
         debug = self.debug if debug is None else debug
         cmd_id = self.STOP.__qualname__ if cmd_id is None else cmd_id
-        debug_info_header(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
+        if debug:
+            debug_info_header(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
         
-        _wcd = None
         
         if delay_before:
             await asyncio.sleep(delay_before)
         
-        command = CMD_MODE_DATA_DIRECT(synced=self.synced,
-                                       port=self.port,
-                                       start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
-                                       completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
-                                       preset_mode=WRITEDIRECT_MODE.SET_MOTOR_POWER,
-                                       motor_position=0,
-                                       )
+        command = self._stop_command()
         
-        debug_info_begin(f"    <MOTOR {self.name} -- PORT {self.port[0]}>: sending {command.COMMAND.hex()}",
-                         debug=debug)
+        if debug:
+            debug_info_begin(f"    <MOTOR {self.name} -- PORT {self.port[0]}>: sending {command.COMMAND.hex()}",
+                             debug=debug)
         s = await self._cmd_send(command)
-        debug_info(f"        <MOTOR {self.name} -- PORT {self.port[0]}>: DELIVERED {command.COMMAND.hex()}",
-                   debug=debug)
-        await self.E_CMD_FINISHED.wait()
-        debug_info(
-            f"        <MOTOR {self.name} -- PORT {self.port[0]}>:    RECEIVED & EXECUTED {command.COMMAND.hex()}",
-            debug=debug)
-        debug_info_end(f"    <MOTOR {self.name} -- PORT {self.port[0]}>:    sending {command.COMMAND.hex()}",
+        if debug:
+            debug_info(f"        <MOTOR {self.name} -- PORT {self.port[0]}>: DELIVERED {command.COMMAND.hex()}",
                        debug=debug)
+        await self.E_CMD_FINISHED.wait()
+        if debug:
+            debug_info(
+                f"        <MOTOR {self.name} -- PORT {self.port[0]}>:    RECEIVED & EXECUTED {command.COMMAND.hex()}",
+                debug=debug)
+            debug_info_end(f"    <MOTOR {self.name} -- PORT {self.port[0]}>:    sending {command.COMMAND.hex()}",
+                           debug=debug)
         
         if delay_after:
             await asyncio.sleep(delay_after)
         
-        debug_info_footer(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
+        if debug:
+            debug_info_footer(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
         
         return s
     
+    def _stop_command(self) -> CMD_MODE_DATA_DIRECT:
+        """Return the STOP command for this motor.
+        
+        All parameters of the STOP command are fixed for a given port, so the command is built once and rebuilt only
+        if the port changes (e.g., a virtual port gets assigned).
+        
+        Returns
+        -------
+        CMD_MODE_DATA_DIRECT
+            The cached STOP command.
+            
+        """
+        if (self._stop_cmd is None) or (self._stop_cmd.port != self.port):
+            self._stop_cmd = CMD_MODE_DATA_DIRECT(synced=self.synced,
+                                                  port=self.port,
+                                                  start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                                                  completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                                                  preset_mode=WRITEDIRECT_MODE.SET_MOTOR_POWER,
+                                                  motor_position=0,
+                                                  )
+        return self._stop_cmd
+    
+    def _set_position_command(self, pos: int) -> CMD_MODE_DATA_DIRECT:
+        """Return a SET_POSITION command for `pos`.
+        
+        The command is copied from a per-port template and only the trailing position value is patched in.
+        
+        Parameters
+        ----------
+        pos : int
+            The new position value.
+            
+        Returns
+        -------
+        CMD_MODE_DATA_DIRECT
+            The SET_POSITION command.
+            
+        """
+        if (self._set_pos_cmd is None) or (self._set_pos_cmd.port != self.port):
+            self._set_pos_cmd = CMD_MODE_DATA_DIRECT(port=self.port,
+                                                     start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
+                                                     completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
+                                                     preset_mode=WRITEDIRECT_MODE.SET_POSITION,
+                                                     motor_position=0,
+                                                     )
+        command = copy(self._set_pos_cmd)
+        command.motor_position = pos
+        command.COMMAND = bytearray(self._set_pos_cmd.COMMAND)
+        _POSITION.pack_into(command.COMMAND, len(command.COMMAND) - 4, int(round(pos * command.gearRatio)))
+        return command
+    
     async def SET_POSITION(self,
                            pos: int = 0,
                            wait_cond: Union[Awaitable, Callable] = None,
@@ -1258,68 +1324,64 @@ class AMotor(ADevice):
                            debug: Optional[bool] = None,
                            ):
         
-        _wcd = None
         debug = self.debug if debug is None else debug
         
-        command = CMD_MODE_DATA_DIRECT(
-                port=self.port,
-                start_cond=MOVEMENT.ONSTART_EXEC_IMMEDIATELY,
-                completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
-                preset_mode=WRITEDIRECT_MODE.SET_POSITION,
-                motor_position=pos,
-                )
+        command = self._set_position_command(pos)
         
-        debug_info_header(f"THE {cmd_id} ++ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
+        if debug:
+            debug_info_header(f"THE {cmd_id} ++ <MOTOR {self.name} -- PORT {self.port[0]}>", debug=debug)
         
-        debug_info(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT...", debug=debug)
+            debug_info(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT...", debug=debug)
         self.port_free.clear()
-        debug_info(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}PASSED",
-                   debug=debug)
+        if debug:
+            debug_info(_GATES_PASSED.format(op=cmd_id, name=self.name, port=self.port[0]),
+                       debug=debug)
         
         # _wait_until part
         if wait_cond:
-            _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-            await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
         
-        debug_info_begin(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}WAITING",
-                debug=debug)
+        if debug:
+            debug_info_begin(
+                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}WAITING",
+                    debug=debug)
         
         s = await self._cmd_send(command)
         
-        debug_info(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}SENT",
-                debug=debug)
+        if debug:
+            debug_info(
+                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>: SENDING {command.COMMAND.hex()}: {C.WARNING}SENT",
+                    debug=debug)
         # NO WAIT FOR CMD STARTED AS WRITEDIRECT
         t0 = monotonic()
-        debug_info_begin(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITING FOR COMMAND TO END: t0={t0}s",
-            debug=debug)
+        if debug:
+            debug_info_begin(
+                f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITING FOR COMMAND TO END: t0={t0}s",
+                debug=debug)
         await self.E_CMD_FINISHED.wait()  # Wait for CMD-Status other than `started<<<<<<<`
-        debug_info_end(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITED {monotonic() - t0}s FOR COMMAND TO END",
-            debug=debug)
-        
-        debug_info_end(
-            f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): SENT, RECEIVED AND PROCESSED: {command.COMMAND.hex()}",
-            debug=debug)
-        if delay_after is not None:
-            debug_info_begin(f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
-                             debug=debug)
+        if debug:
+            debug_info_end(
+                f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): WAITED {monotonic() - t0}s FOR COMMAND TO END",
+                debug=debug)
+        
+            debug_info_end(
+                f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): SENT, RECEIVED AND PROCESSED: {command.COMMAND.hex()}",
+                debug=debug)
+        if delay_after:
+            if debug:
+                debug_info_begin(f"{cmd_id} +*+ MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
+                                 debug=debug)
             
             await sleep(delay_after)
             
-            debug_info_end(f"CMD {cmd_id}MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
-                           debug=debug)
+            if debug:
+                debug_info_end(f"CMD {cmd_id}MOTOR {self.name} -- PORT {self.port[0]}.SET_POSITION(): delay_after",
+                               debug=debug)
         
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except CancelledError as ce:
-            print(f"CMD: {cmd_id} + ++ ) WAIT_CONDITION.cancel() error")
         
-        debug_info_footer(f"COMMAND {cmd_id}: <MOTOR {self.name} -- PORT {self.port[0]}> ++ dt = {monotonic() - t0}..",
-                          debug=debug)
+        if debug:
+            debug_info_footer(f"COMMAND {cmd_id}: <MOTOR {self.name} -- PORT {self.port[0]}> ++ dt = {monotonic() - t0}..",
+                              debug=debug)
         
         return s
     
@@ -1397,100 +1459,68 @@ class AMotor(ADevice):
         `LEGO(c): START MOVE DEGREES <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#output-sub-command-startspeedfordegrees-degrees-speed-maxpower-endstate-useprofile-0x0b>`_
        
         """
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
         
         if isinstance(speed, DIRECTIONAL_VALUE):
-            _speed = speed.value * int(np.sign(degrees)) * self.clockwise_direction
+            _speed = speed.value * _sign(degrees) * self.clockwise_direction
+        else:
+            _speed = speed * _sign(degrees) * self.clockwise_direction
+        gear_ratio = self.gear_ratio
+        if (gear_ratio == 1.0) and isinstance(degrees, int):
+            _degrees = abs(degrees)  # nothing to scale or round for the usual direct drive
         else:
-            _speed = speed * int(np.sign(degrees)) * self.clockwise_direction
-        _degrees = int(round(abs(degrees * self.gear_ratio)))  # normalize left/right
+            _degrees = int(round(abs(degrees * gear_ratio)))  # normalize left/right
         _abs_max_power = abs(abs_max_power)
         
         debug = self.debug if debug is None else debug
         
-        command = CMD_START_MOVE_DEV_DEGREES(
-                synced=False,
-                port=self.port,
-                start_cond=start_cond,
-                completion_cond=completion_cond,
-                degrees=_degrees,
-                speed=_speed,
-                abs_max_power=_abs_max_power,
-                on_completion=on_completion,
-                use_profile=use_profile,
-                use_acc_profile=use_acc_profile,
-                use_dec_profile=use_dec_profile,
-                )
-        
-        debug_info_header(f"COMMAND {cmd_id} +*+ <{self.name}: {self.port[0]}>", debug=debug)
-        debug_info_begin(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}WAITING",
-                         debug=debug)
-        async with self.port_free_condition:
-            
-            debug_info_begin(f"{cmd_id} +*+ {self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}WAITING",
-                             debug=debug)
-            debug_info(f"{cmd_id} +*+ {self.name}: {self.port[0]}>: PORT FREEE STATUS: {self.port_free.is_set()}",
-                       debug=debug)
-            
-            await self.port_free.wait()
-            self.port_free.clear()
-            
-            debug_info_end(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: PORT_FREE.is_set(): {C.WARNING}SET",
-                           debug=debug)
-            debug_info(f"CMD {cmd_id} +*+ <{self.name}: {self.port[0]}>: LOCKING PORT", debug=debug)
-            
-            debug_info_end(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>: AT THE GATES: {C.WARNING}PASSED",
-                           debug=debug)
-            
-            if delay_before is not None:
-                debug_info_begin(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=debug)
-                await sleep(delay_before)
-                debug_info_end(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying [send_cmd({command.COMMAND.hex()})] for: {delay_before}-T0]",
-                        debug=debug)
-            
+        port = self.port
+        # repeated commands with identical arguments reuse the previously built command
+        cmd_key = (port, start_cond, completion_cond, _degrees, _speed, _abs_max_power, on_completion, use_profile,
+                   use_acc_profile, use_dec_profile)
+        if (self._degrees_cmd is not None) and (self._degrees_cmd[0] == cmd_key):
+            command = self._degrees_cmd[1]
+        else:
+            command = CMD_START_MOVE_DEV_DEGREES(
+                    synced=False,
+                    port=port,
+                    start_cond=start_cond,
+                    completion_cond=completion_cond,
+                    degrees=_degrees,
+                    speed=_speed,
+                    abs_max_power=_abs_max_power,
+                    on_completion=on_completion,
+                    use_profile=use_profile,
+                    use_acc_profile=use_acc_profile,
+                    use_dec_profile=use_dec_profile,
+                    )
+            self._degrees_cmd = (cmd_key, command)
+        
+        op = 'START_MOVE_DEGREES' if cmd_id is None else cmd_id
+        if debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, debug):
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
             
-            debug_info_begin(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}]",
-                debug=debug)
+            if debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=debug)
             s = await self._cmd_send(command)
             await self.E_CMD_STARTED.wait()
-            t0 = monotonic()
-            debug_info_end(
-                f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    sending {command.COMMAND.hex()}]",
-                debug=debug)
-            debug_info_begin(f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for "
-                             f"{command.COMMAND.hex()} to finish]", debug=debug)
             
+            t0 = monotonic()
+            if debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info_end(
-                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    waiting for {command.COMMAND.hex()} to finish]",
-                    debug=debug)
-            
-            if delay_after:
-                debug_info_begin(
-                    f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}]",
-                    debug=debug)
-                await sleep(delay_after)
-                debug_info_end(
-                        f"{cmd_id} +*+ <MOTOR {self.name} -- PORT {self.port[0]}>    delaying return from method for {delay_after}]",
-                        debug=debug)
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()
-            except (CancelledError, AttributeError, TypeError):
-                pass
-            self.port_free_condition.notify_all()
-        debug_info_footer(f"{cmd_id} +*+ <{self.name}: {self.port[0]}>", debug=debug)
+            if debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - t0}s", debug=debug)
+        
+        if debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=debug)
         return s
     
     async def START_SPEED_TIME(
@@ -1550,87 +1580,58 @@ class AMotor(ADevice):
         `LEGO(c): START SPEED FOR TIME <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#output-sub-command-startspeedfortime-time-speed-maxpower-endstate-useprofile-0x09>`_.
         
         """
-        self.time_to_stalled = time_to_stalled
+        port = self.port
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
-        _wcd = None
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value * self.clockwise_direction  # normalize speed
         else:
             _speed = speed * self.clockwise_direction  # normalize speed
         _debug = self.debug if debug is None else debug
         
-        command = CMD_START_MOVE_DEV_TIME(
-                port=self.port,
-                start_cond=start_cond,
-                completion_cond=completion_cond,
-                time=time,
-                speed=_speed,
-                power=power,
-                on_completion=on_completion,
-                use_profile=use_profile,
-                use_acc_profile=use_acc_profile,
-                use_dec_profile=use_dec_profile)
-        
-        async with self.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            
-            debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # PASSED THE GATES",
-                           debug=_debug)
-            
-            if delay_before is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_before {delay_before}s",
-                        debug=_debug)
-                await sleep(delay_before)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_before {delay_before}s",
-                        debug=_debug)
-            
-            debug_info_begin(
-                    f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # sending CMD",
-                    debug=_debug)
+        # repeated commands with identical arguments reuse the previously built command
+        cmd_key = (port, start_cond, completion_cond, time, _speed, power, on_completion, use_profile,
+                   use_acc_profile, use_dec_profile)
+        if (self._speed_time_cmd is not None) and (self._speed_time_cmd[0] == cmd_key):
+            command = self._speed_time_cmd[1]
+        else:
+            command = CMD_START_MOVE_DEV_TIME(
+                    port=port,
+                    start_cond=start_cond,
+                    completion_cond=completion_cond,
+                    time=time,
+                    speed=_speed,
+                    power=power,
+                    on_completion=on_completion,
+                    use_profile=use_profile,
+                    use_acc_profile=use_acc_profile,
+                    use_dec_profile=use_dec_profile)
+            self._speed_time_cmd = (cmd_key, command)
+        
+        op = 'START_SPEED_TIME' if cmd_id is None else cmd_id
+        if _debug:
+            debug_info_header(f"COMMAND {op} +*+ <{self.name}: {self.port[0]}>", debug=_debug)
+        
+        async with self._port_gate(op, delay_before, delay_after, _debug):
             # _wait_until part
             if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+                await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
             
+            if _debug:
+                debug_info(f"{op} +*+ <{self.name}: {self.port[0]}>:    CMD: {command.COMMAND.hex()}", debug=_debug)
             s = await self._cmd_send(command)
-            
-            debug_info(f"CMD:  {cmd_id} +++ [{self.name}:{self.port}]: WAITING FOR COMMAND TO START", debug=_debug)
             await self.E_CMD_STARTED.wait()
+            
             t0 = monotonic()
-            debug_info(f"CMD:  {cmd_id} +++ WAITING FOR COMMAND END: t0={t0}s", debug=_debug)
+            if _debug:
+                debug_info_begin(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITING FOR COMMAND END", debug=_debug)
             await self.E_CMD_FINISHED.wait()
-            debug_info(f"CMD:  {cmd_id} +++ WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=_debug)
-            
-            debug_info(
-                f"CMD:  {cmd_id} +++ NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # CMD: {command}",
-                debug=_debug)
-            debug_info_end(
-                f"CMD:  {cmd_id} +++ NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # sending CMD",
-                debug=_debug)
-            
-            if delay_after is not None:
-                debug_info_begin(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_after {delay_after}s",
-                        debug=_debug)
-                await sleep(delay_after)
-                debug_info_end(
-                        f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME # delay_after {delay_after}s",
-                        debug=_debug)
-            
-            try:
-                if _wcd is not None:
-                    _wcd.cancel()  # end Task
-                    await _wcd  # check if really ended
-            except (CancelledError, AttributeError, TypeError):
-                pass
-            self.port_free_condition.notify_all()
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME",
-                          debug=_debug)
+            if _debug:
+                debug_info_end(f"{op} +*+ <{self.name}: {self.port[0]}>:    WAITED dt={monotonic() - t0}s", debug=_debug)
         
+        if _debug:
+            debug_info_footer(f"COMMAND {op}: <{self.name}: {self.port[0]}>", debug=_debug)
         return s
     
     @property
@@ -1668,9 +1669,13 @@ class AMotor(ADevice):
         """
         raise NotImplementedError
     
+    def _distance_start_end(self, gear_ratio=1.0) -> np.ndarray:
+        diff = np.subtract(self.measure_end, self.measure_start, dtype=np.float64)
+        diff /= gear_ratio  # in place, the difference is a fresh array
+        return diff
+    
     def distance_start_end(self, gear_ratio=1.0) -> Tuple:
-        r = tuple(map(lambda x, y: (x - y) / gear_ratio, self.measure_end, self.measure_start))
-        return r
+        return tuple(self._distance_start_end(gear_ratio).tolist())
     
     @property
     @abstractmethod
@@ -1687,10 +1692,10 @@ class AMotor(ADevice):
         raise NotImplementedError
     
     def avg_speed_old(self, gear_ratio=1.0) -> Tuple:
-        startend = self.distance_start_end(gear_ratio)
-        dt = abs(startend[len(startend) - 1])
-        r = tuple(map(lambda x: (x / dt), startend))
-        return r
+        startend = self._distance_start_end(gear_ratio)
+        # not in place: SynchronizedMotor hands out its shared measurement buffer
+        startend = startend / abs(startend[-1])
+        return tuple(startend.tolist())
     
     @property
     @abstractmethod
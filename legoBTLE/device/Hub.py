@@ -6,15 +6,15 @@
     This module contains the :class:`Hub` that models the LEGO\ |copy| central hub brick.
 """
 
-import asyncio
 import uuid
 from asyncio import Condition
 from asyncio import Event
 from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
-from datetime import datetime
+from collections import deque
+from time import monotonic
 from typing import Callable
-from typing import List
+from typing import Deque
 from typing import Optional
 from typing import Tuple
 
@@ -45,6 +45,14 @@ from legoBTLE.legoWP.types import WRITEDIRECT_MODE
 
 class Hub(ADevice):
     
+    __slots__ = ('_DEVNAME', '_E_CMD_FINISHED', '_E_CMD_STARTED', '_cmd_feedback_log', '_cmd_feedback_notification',
+                 '_cmd_return_code', '_connection', '_debug', '_error_notification', '_error_notification_log',
+                 '_ext_srv_connected', '_ext_srv_disconnected', '_external_srv_notification',
+                 '_external_srv_notification_log', '_hub_action_notification', '_hub_action_notification_log',
+                 '_hub_alert', '_hub_alert_notification', '_hub_alert_notification_log',
+                 '_hub_attached_io_notification', '_id', '_internal_devs', '_last_cmd_failed', '_last_cmd_snt',
+                 '_name', '_port', '_port2hub_connected', '_port_free', '_port_free_condition', '_server')
+    
     def __init__(self, server, name: str = 'LegoTechnicHub', debug: bool = False):
         """
         This class models the central LEGO\ |copy| Hub Brick.
@@ -87,7 +95,7 @@ class Hub(ADevice):
         self._server = server
         self._connection: [StreamReader, StreamWriter] = None
         self._external_srv_notification: Optional[EXT_SERVER_NOTIFICATION] = None
-        self._external_srv_notification_log: List[Tuple[float, EXT_SERVER_NOTIFICATION]] = []
+        self._external_srv_notification_log: Deque[Tuple[float, EXT_SERVER_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         self._ext_srv_connected: Event = Event()
         self._ext_srv_connected.clear()
         self._ext_srv_disconnected: Event = Event()
@@ -105,20 +113,20 @@ class Hub(ADevice):
         self._cmd_return_code: Optional[CMD_RETURN_CODE] = None
         
         self._cmd_feedback_notification: Optional[PORT_CMD_FEEDBACK] = None
-        self._cmd_feedback_log: List[Tuple[float, PORT_CMD_FEEDBACK]] = []
+        self._cmd_feedback_log: Deque[Tuple[float, PORT_CMD_FEEDBACK]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
         self._hub_attached_io_notification: Optional[HUB_ATTACHED_IO_NOTIFICATION] = None
         self._internal_devs: dict = {}
         
         self._hub_alert_notification: Optional[HUB_ALERT_NOTIFICATION] = None
-        self._hub_alert_notification_log: List[Tuple[float, HUB_ALERT_NOTIFICATION]] = []
+        self._hub_alert_notification_log: Deque[Tuple[float, HUB_ALERT_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         self._hub_alert: Event = Event()
         self._hub_alert.clear()
         self._hub_action_notification: Optional[HUB_ACTION_NOTIFICATION] = None
-        self._hub_action_notification_log: List[Tuple[float, HUB_ACTION_NOTIFICATION]] = []
+        self._hub_action_notification_log: Deque[Tuple[float, HUB_ACTION_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
         self._error_notification: Optional[DEV_GENERIC_ERROR_NOTIFICATION] = None
-        self._error_notification_log: List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = []
+        self._error_notification_log: Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
         self._E_CMD_STARTED: Event = Event()
         self._E_CMD_FINISHED: Event = Event()
@@ -165,7 +173,7 @@ class Hub(ADevice):
         if ext_srv_notification is not None:
             self._external_srv_notification = ext_srv_notification
             if self.debug:
-                self.ext_srv_notification_log.append((datetime.timestamp(datetime.now()), ext_srv_notification))
+                self.ext_srv_notification_log.append((monotonic(), ext_srv_notification))
             if ext_srv_notification.m_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED:
                 if debug:
                     print(f"SERVER NOTIFICATION RECEIVED: {ext_srv_notification.COMMAND}")
@@ -182,7 +190,7 @@ class Hub(ADevice):
             raise RuntimeError(f"NoneType Notification from Server received...")
     
     @property
-    def ext_srv_notification_log(self) -> List[Tuple[float, EXT_SERVER_NOTIFICATION]]:
+    def ext_srv_notification_log(self) -> Deque[Tuple[float, EXT_SERVER_NOTIFICATION]]:
         return self._external_srv_notification_log
     
     @property
@@ -191,11 +199,11 @@ class Hub(ADevice):
     
     async def error_notification_set(self, error: DEV_GENERIC_ERROR_NOTIFICATION):
         self._error_notification = error
-        self._error_notification_log.append((datetime.timestamp(datetime.now()), error))
+        self._error_notification_log.append((monotonic(), error))
         return
     
     @property
-    def error_notification_log(self) -> List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
+    def error_notification_log(self) -> Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
         return self._error_notification_log
     
     @property
@@ -209,7 +217,7 @@ class Hub(ADevice):
                                                       HUB_ACTION.UPS_HUB_WILL_BOOT):
             
             if self._debug:
-                self._hub_action_notification_log.append((datetime.timestamp(datetime.now()), action))
+                self._hub_action_notification_log.append((monotonic(), action))
                 print(f"[{self._name}:{self._port.hex()}]-[MSG]: SOON {action.m_return_str}...")
         return
 
@@ -226,11 +234,8 @@ class Hub(ADevice):
             
             # _wait_until part
             if waitUntilCond is not None:
-                fut = asyncio.get_running_loop().create_future()
-                await self._wait_until(waitUntilCond, fut)
-                done = await asyncio.wait_for(fut, timeout=waitUntil_timeout)
+                await self._await_cond(waitUntilCond, waitUntil_timeout)
             s = await self._cmd_send(current_command)
-            self._port_free_condition.notify_all()
         
         return s
 
@@ -246,11 +251,8 @@ class Hub(ADevice):
             await self._ext_srv_connected.wait()
             # _wait_until part
             if waitUntilCond is not None:
-                fut = asyncio.get_running_loop().create_future()
-                await self._wait_until(waitUntilCond, fut)
-                done = await asyncio.wait_for(fut, timeout=waitUntil_timeout)
+                await self._await_cond(waitUntilCond, waitUntil_timeout)
             s = await self._cmd_send(current_command)
-            self._port_free_condition.notify_all()
 
         return s
     
@@ -297,8 +299,8 @@ class Hub(ADevice):
         """
         _cmd_id = self.REQ_PORT_NOTIFICATION.__qualname__ if cmd_id is None else cmd_id
         current_command = CMD_GENERAL_NOTIFICATION_HUB_REQ()
-        print(f"HUB GENERAL NOTIFICATION REQUEST COMMAND GENERATED: {current_command.COMMAND.hex()}")
         if self._debug:
+            print(f"HUB GENERAL NOTIFICATION REQUEST COMMAND GENERATED: {current_command.COMMAND.hex()}")
             print(f"[{self._name}:{self._port[0]}]-[MSG]: WAITING AT THE GATES...")
         async with self._port_free_condition:
             await self._ext_srv_connected.wait()
@@ -306,14 +308,11 @@ class Hub(ADevice):
                 print(f"[{self._name}:{self._port[0]}]-[MSG]: PASSED THE GATES...")
             # _wait_until part
             if waitUntilCond is not None:
-                fut = asyncio.get_running_loop().create_future()
-                await self._wait_until(waitUntilCond, fut)
-                done = await asyncio.wait_for(fut, timeout=waitUntil_timeout)
+                await self._await_cond(waitUntilCond, waitUntil_timeout)
             s = await self._cmd_send(current_command)
             if self._debug:
                 print(f"[{self._name}:{self._port[0]}]-[MSG]: COMMAND {current_command.COMMAND} sent, RESULT {s}")
     
-            self._port_free_condition.notify_all()
         
         return s
     
@@ -332,14 +331,12 @@ class Hub(ADevice):
         else:
             current_command = HUB_ALERT_NOTIFICATION_REQ(hub_alert=hub_alert, hub_alert_op=hub_alert_op)
             async with self._port_free_condition:
-                print(f"{self._name}.HUB_ALERT_REQ WAITING AT THE GATES...")
+                if self._debug:
+                    print(f"{self._name}.HUB_ALERT_REQ WAITING AT THE GATES...")
                 # _wait_until part
                 if waitUntilCond is not None:
-                    fut = asyncio.get_running_loop().create_future()
-                    await self._wait_until(waitUntilCond, fut)
-                    done = await asyncio.wait_for(fut, timeout=waitUntil_timeout)
+                    await self._await_cond(waitUntilCond, waitUntil_timeout)
                 s = await self._cmd_send(current_command)
-                self._port_free_condition.notify_all()
             return s
     
     @property
@@ -348,13 +345,13 @@ class Hub(ADevice):
     
     async def hub_alert_notification_set(self, alert: HUB_ALERT_NOTIFICATION):
         self._hub_alert_notification = alert
-        self._hub_alert_notification_log.append((datetime.timestamp(datetime.now()), alert))
+        self._hub_alert_notification_log.append((monotonic(), alert))
         self._hub_alert.set()
         if alert.hub_alert_status == ALERT_STATUS.ALERT:
             raise ResourceWarning(f"Hub Alert Received: {alert.hub_alert_type_str}")
     
     @property
-    def hub_alert_notification_log(self) -> List[Tuple[float, HUB_ALERT_NOTIFICATION]]:
+    def hub_alert_notification_log(self) -> Deque[Tuple[float, HUB_ALERT_NOTIFICATION]]:
         return self._hub_alert_notification_log
     
     def hub_alert(self) -> Event:
@@ -405,11 +402,11 @@ class Hub(ADevice):
     async def cmd_feedback_notification_set(self, notification: PORT_CMD_FEEDBACK):
         
         self._cmd_feedback_notification = notification
-        self._cmd_feedback_log.append((datetime.timestamp(datetime.now()), notification))
+        self._cmd_feedback_log.append((monotonic(), notification))
         return
     
     @property
-    def cmd_feedback_log(self) -> List[Tuple[float, PORT_CMD_FEEDBACK]]:
+    def cmd_feedback_log(self) -> Deque[Tuple[float, PORT_CMD_FEEDBACK]]:
         return self._cmd_feedback_log
     
     @property
@@ -5,21 +5,27 @@ legoBTLE.device.SingleMotor
 A concrete :class:`AMotor`.
     
 """
+import math
 import uuid
 from asyncio import Condition, Task
 from asyncio import Event
 from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
 from collections import defaultdict
-from datetime import datetime
-from typing import Awaitable, Callable, List
+from collections import deque
+from time import monotonic
+from typing import Awaitable, Callable, Deque, List
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
-import numpy as np
-
 from legoBTLE.device.AMotor import AMotor
+from legoBTLE.legoWP.message.downstream import CMD_GOTO_ABS_POS_DEV
+from legoBTLE.legoWP.message.downstream import CMD_MODE_DATA_DIRECT
+from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_DEGREES
+from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_TIME
+from legoBTLE.legoWP.message.downstream import CMD_START_PWR_DEV
+from legoBTLE.legoWP.message.downstream import CMD_START_SPEED_DEV
 from legoBTLE.legoWP.message.downstream import DOWNSTREAM_MESSAGE
 from legoBTLE.legoWP.message.upstream import DEV_GENERIC_ERROR_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import DEV_PORT_NOTIFICATION
@@ -33,12 +39,17 @@ from legoBTLE.legoWP.types import CMD_FEEDBACK_MSG
 from legoBTLE.legoWP.types import MOVEMENT
 from legoBTLE.legoWP.types import PERIPHERAL_EVENT
 from legoBTLE.legoWP.types import PORT
+from legoBTLE.legoWP.types import SI
 from legoBTLE.networking.prettyprint.debug import debug_info
 from legoBTLE.networking.prettyprint.debug import debug_info_begin
 from legoBTLE.networking.prettyprint.debug import debug_info_end
 from legoBTLE.networking.prettyprint.debug import debug_info_footer
 from legoBTLE.networking.prettyprint.debug import debug_info_header
 
+# command feedback status byte, see :class:`legoBTLE.legoWP.types.CMD_FEEDBACK_MSG`
+_CMD_STARTED: int = 0x01  # buffer empty, command in progress
+_CMD_EXECUTED: int = 0x0A  # buffer empty, command completed, port idle
+
 
 class SingleMotor(AMotor):
     """A single motor.
@@ -48,6 +59,20 @@ class SingleMotor(AMotor):
     Objects from this class represent a single LEGO\ |copy| Motor.
     
     """
+    
+    __slots__ = ('_DEVNAME', '_E_CMD_FINISHED', '_E_CMD_STARTED', '_E_MOTOR_STALLED', '_ON_STALLED_ACTION',
+                 '__e_port_value_rcv', '_abs_max_distance', '_acc_dec_profiles', '_angle_cache', '_avg_speed',
+                 '_clockwise_direction', '_cmd_feedback_log', '_cmd_time_to_stalled', '_connection',
+                 '_current_cmd_feedback_notification', '_current_cmd_feedback_notification_str', '_current_profile',
+                 '_current_value', '_debug', '_degrees_cmd', '_distance', '_distance_scale', '_error_notification',
+                 '_error_notification_log', '_ext_srv_connected', '_ext_srv_disconnected', '_ext_srv_notification',
+                 '_ext_srv_notification_log', '_gear_ratio', '_goto_cmd', '_hub_action_notification', '_hub_alert',
+                 '_hub_alert_notification', '_hub_alert_notification_log', '_hub_attached_io_notification', '_id',
+                 '_last_angle_cache', '_last_cmd_failed', '_last_cmd_snt', '_last_value', '_max_avg_speed',
+                 '_max_steering_angle', '_measure_distance_end', '_measure_distance_start', '_name', '_port',
+                 '_port2hub_connected', '_port_free', '_port_free_condition', '_port_notification', '_power_cmd',
+                 '_server', '_set_pos_cmd', '_speed_cmd', '_speed_time_cmd', '_stall_bias', '_stall_guard',
+                 '_stop_cmd', '_synced', '_time_to_stalled', '_total_distance', '_wheel_diameter')
 
     def __init__(self,
                  server: Tuple[str, int],
@@ -118,10 +143,10 @@ class SingleMotor(AMotor):
         self.__e_port_value_rcv: Event = Event()  # has some value already been received
         
         self._time_to_stalled: float = time_to_stalled
+        self._cmd_time_to_stalled: Optional[float] = time_to_stalled
         self._stall_bias: float = stall_bias
         self._ON_STALLED_ACTION: Optional[Callable[[], Awaitable]] = None
         self._E_MOTOR_STALLED: Event = Event()
-        self._E_DETECT_STALLING: Event = Event()
         self._stall_guard: Optional[Task] = None
     
         self._last_cmd_snt: Optional[DOWNSTREAM_MESSAGE] = None
@@ -129,7 +154,7 @@ class SingleMotor(AMotor):
         
         self._current_cmd_feedback_notification: Optional[PORT_CMD_FEEDBACK] = None
         self._current_cmd_feedback_notification_str: Optional[str] = None
-        self._cmd_feedback_log: List[Tuple[float, CMD_FEEDBACK_MSG]] = []
+        self._cmd_feedback_log: Deque[Tuple[float, CMD_FEEDBACK_MSG]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
         self._server: [str, int] = server
         self._ext_srv_connected: Event = Event()
@@ -137,7 +162,6 @@ class SingleMotor(AMotor):
         self._ext_srv_notification: Optional[EXT_SERVER_NOTIFICATION] = None
         self._ext_srv_notification_log: Optional[List[Tuple[float, EXT_SERVER_NOTIFICATION]]] = None
         self._connection: Optional[Tuple[StreamReader, StreamWriter]] = None
-        self._error: Event = Event()
         self._ext_srv_disconnected: Event = Event()
         self._ext_srv_disconnected.set()
         self._hub_alert: Event = Event()
@@ -146,11 +170,14 @@ class SingleMotor(AMotor):
     
         self._wheel_diameter: float = wheel_diameter
         self._gear_ratio: float = gear_ratio
+        self._distance_scale: float = gear_ratio * math.pi * wheel_diameter / 360  # degrees -> mm
         self._distance: float = 0.0
         self._total_distance: float = 0.0
         
         self._current_value: Optional[PORT_VALUE] = None
         self._last_value: Optional[PORT_VALUE] = None
+        self._angle_cache: Tuple[Optional[PORT_VALUE], Optional[SI], Optional[float]] = (None, None, None)
+        self._last_angle_cache: Tuple[Optional[PORT_VALUE], Optional[SI], Optional[float]] = (None, None, None)
         
         self._measure_distance_start = None
         self._measure_distance_end = None
@@ -160,16 +187,24 @@ class SingleMotor(AMotor):
         self._max_avg_speed: float = 0.0
         
         self._error_notification: Optional[DEV_GENERIC_ERROR_NOTIFICATION] = None
-        self._error_notification_log: List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = []
+        self._error_notification_log: Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
         self._hub_action_notification: Optional[HUB_ACTION_NOTIFICATION] = None
         self._hub_attached_io_notification: Optional[HUB_ATTACHED_IO_NOTIFICATION] = None
         self._hub_alert_notification: Optional[HUB_ALERT_NOTIFICATION] = None
-        self._hub_alert_notification_log: List[Tuple[float, HUB_ALERT_NOTIFICATION]] = []
+        self._hub_alert_notification_log: Deque[Tuple[float, HUB_ALERT_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         
-        self._acc_dec_profiles: defaultdict = defaultdict(defaultdict)
+        self._acc_dec_profiles: dict = {}
         self._current_profile: defaultdict = defaultdict(None)
         
+        self._stop_cmd: Optional[CMD_MODE_DATA_DIRECT] = None
+        self._set_pos_cmd: Optional[CMD_MODE_DATA_DIRECT] = None
+        self._power_cmd: Optional[Tuple[tuple, CMD_START_PWR_DEV]] = None
+        self._speed_cmd: Optional[Tuple[tuple, CMD_START_SPEED_DEV]] = None
+        self._speed_time_cmd: Optional[Tuple[tuple, CMD_START_MOVE_DEV_TIME]] = None
+        self._goto_cmd: Optional[Tuple[tuple, CMD_GOTO_ABS_POS_DEV]] = None
+        self._degrees_cmd: Optional[Tuple[tuple, CMD_START_MOVE_DEV_DEGREES]] = None
+        
         self._clockwise_direction: MOVEMENT = clockwise
         
         self._max_steering_angle: float = max_steering_angle
@@ -265,7 +300,7 @@ class SingleMotor(AMotor):
 
             :math:``\frac{\sum_{i=1}^{\infty} x_{i}}{\infty}``
         """
-        return self._total_distance * self._gear_ratio * np.pi * self._wheel_diameter / 360
+        return self._total_distance * self._distance_scale
     
     @total_distance.setter
     def total_distance(self, distance: float):
@@ -312,11 +347,16 @@ class SingleMotor(AMotor):
         -------
         None
         """
-        self._last_value = self._current_value if self._current_value is not None else value
+        # called for every port value notification: read the attributes once, not through the properties
+        last_value = self._current_value
+        if last_value is None:
+            last_value = value
+        self._last_value = last_value
         self._current_value = value
         self.__e_port_value_rcv.set()
-        debug_info(f"{self._name}:{self._port[0]} >>>>>>>> CURRENTVALUE: {value.m_port_value_DEG}", debug=self.debug)
-        self._total_distance += abs(self._current_value.m_port_value_DEG - self._last_value.m_port_value_DEG)
+        if self._debug:
+            debug_info(f"{self._name}:{self._port[0]} >>>>>>>> CURRENTVALUE: {value.m_port_value_DEG}", debug=True)
+        self._total_distance += abs(value.m_port_value_DEG - last_value.m_port_value_DEG)
         
         return
     
@@ -352,7 +392,7 @@ class SingleMotor(AMotor):
     
     @ON_STALLED_ACTION.deleter
     def ON_STALLED_ACTION(self):
-        del self._ON_STALLED_ACTION
+        self._ON_STALLED_ACTION = None  # sentinel: no action, the attribute itself stays
         return
     
     @property
@@ -390,11 +430,11 @@ class SingleMotor(AMotor):
         return
     
     @property
-    def acc_dec_profiles(self) -> defaultdict:
+    def acc_dec_profiles(self) -> dict:
         return self._acc_dec_profiles
     
     @acc_dec_profiles.setter
-    def acc_dec_profiles(self, profiles: defaultdict):
+    def acc_dec_profiles(self, profiles: dict):
         self._acc_dec_profiles = profiles
         return
     
@@ -419,7 +459,8 @@ class SingleMotor(AMotor):
         return self._port_notification
     
     async def port_notification_set(self, notification: DEV_PORT_NOTIFICATION) -> None:
-        print(f"IN PORT NOTIFICATION: {self._name}")
+        if self._debug:
+            print(f"IN PORT NOTIFICATION: {self._name}")
         if notification.m_status == PERIPHERAL_EVENT.IO_ATTACHED:
             self._port_free.set()
             self._port2hub_connected.set()
@@ -475,11 +516,11 @@ class SingleMotor(AMotor):
     async def hub_alert_notification_set(self, notification: HUB_ALERT_NOTIFICATION) -> None:
         self._hub_alert_notification = notification
         self._hub_alert.set()
-        self._hub_alert_notification_log.append((datetime.timestamp(datetime.now()), notification))
+        self._hub_alert_notification_log.append((monotonic(), notification))
         return
     
     @property
-    def hub_alert_notification_log(self) -> List[Tuple[float, HUB_ALERT_NOTIFICATION]]:
+    def hub_alert_notification_log(self) -> Deque[Tuple[float, HUB_ALERT_NOTIFICATION]]:
         return self._hub_alert_notification_log
     
     @property
@@ -505,12 +546,11 @@ class SingleMotor(AMotor):
         
         """
         self._error_notification = error
-        self._error.set()
-        self._error_notification_log.append((datetime.timestamp(datetime.now()), error))
+        self._error_notification_log.append((monotonic(), error))
         return
     
     @property
-    def error_notification_log(self) -> List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
+    def error_notification_log(self) -> Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
         return self._error_notification_log
     
     @property
@@ -532,6 +572,7 @@ class SingleMotor(AMotor):
             Nothing
         """
         self._wheel_diameter = wheel_diameter
+        self._distance_scale = self._gear_ratio * math.pi * wheel_diameter / 360
         return
 
     @property
@@ -556,6 +597,9 @@ class SingleMotor(AMotor):
         """
         
         self._gear_ratio = gear_ratio
+        self._distance_scale = gear_ratio * math.pi * self._wheel_diameter / 360
+        self._angle_cache = (None, None, None)
+        self._last_angle_cache = (None, None, None)
         return
     
     @property
@@ -609,23 +653,30 @@ class SingleMotor(AMotor):
         debug_info_header(f"[{self._name}].[{__name__}]", debug)
         if notification is not None:
             self._ext_srv_notification = notification
-            print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOT NONE {bytes(self._ext_srv_notification.m_event)} / TYPE: {PERIPHERAL_EVENT.EXT_SRV_CONNECTED}")
-            print(f"COMPARISON: {bytes(self._ext_srv_notification.m_event) == PERIPHERAL_EVENT.EXT_SRV_CONNECTED}")
+            if debug:
+                print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOT NONE {bytes(self._ext_srv_notification.m_event)} / TYPE: {PERIPHERAL_EVENT.EXT_SRV_CONNECTED}")
+                print(f"COMPARISON: {bytes(self._ext_srv_notification.m_event) == PERIPHERAL_EVENT.EXT_SRV_CONNECTED}")
             # if self._debug:
-              #  self._ext_srv_notification_log.append((datetime.timestamp(datetime.now()), notification))
+              #  self._ext_srv_notification_log.append((monotonic(), notification))
             if self._ext_srv_notification.m_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED:
                 self._ext_srv_connected.set()
                 self._ext_srv_disconnected.clear()
                 self._port2hub_connected.set()
                 self._port_free.set()
-                print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOTIFICATION: SUCCESS")
+                if debug:
+                    print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOTIFICATION: SUCCESS")
             elif self._ext_srv_notification.m_event == PERIPHERAL_EVENT.EXT_SRV_DISCONNECTED:
                 self._connection[1].close()
                 self._ext_srv_connected.clear()
                 self._ext_srv_disconnected.set()
                 self._port2hub_connected.clear()
                 self._port_free.clear()
-                print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOTIFICATION: DISCONNECTED SUCCESS")
+                # no feedback will arrive anymore: stop the stall guard instead of leaving it parked until exit
+                if (self._stall_guard is not None) and not self._stall_guard.done():
+                    self._stall_guard.cancel()
+                self._stall_guard = None
+                if debug:
+                    print(f"IN EXTSERVER_NOTIFICATION: {self._name} / NOTIFICATION: DISCONNECTED SUCCESS")
         return
     
     @property
@@ -689,15 +740,17 @@ class SingleMotor(AMotor):
         """
         self._hub_attached_io_notification = io_notification
         if io_notification.m_io_event == PERIPHERAL_EVENT.IO_ATTACHED:
-            debug_info(
-                    f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is ATTACHED... "
-                    f"{io_notification.m_device_type}", debug=self._debug)
+            if self._debug:
+                debug_info(
+                        f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is ATTACHED... "
+                        f"{io_notification.m_device_type}", debug=self._debug)
             self.ext_srv_connected.set()
             self._ext_srv_disconnected.clear()
             self._port_free.set()
             self._port2hub_connected.set()
         elif io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED:
-            debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is DETACHED...", debug=self._debug)
+            if self._debug:
+                debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: MOTOR {self._name} is DETACHED...", debug=self._debug)
             self.ext_srv_connected.clear()
             self._ext_srv_disconnected.set()
             self._port_free.clear()
@@ -707,16 +760,18 @@ class SingleMotor(AMotor):
     
     @property
     def measure_start(self) -> Tuple[float, float]:
-        self._measure_distance_start = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
-        debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
-                  f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
+        self._measure_distance_start = (self._current_value.m_port_value, monotonic())
+        if self._debug:
+            debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
+                      f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
         return self._measure_distance_start
     
     @property
     def measure_end(self) -> Tuple[float, float]:
-        self._measure_distance_end = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
-        debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
-                  f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
+        self._measure_distance_end = (self._current_value.m_port_value, monotonic())
+        if self._debug:
+            debug_info(f"[{self._name}:{self._port[0]}]-[TIME_STOP]: STOP TIME: {self._measure_distance_end[1]}\t"
+                      f"VALUE: {self._measure_distance_end[0]}", debug=self._debug)
         return self._measure_distance_end
     
     @property
@@ -751,33 +806,39 @@ class SingleMotor(AMotor):
             This is a setter
             
         """
-        debug_info_header(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
-        debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}", debug=self._debug)
-        if notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x01', 'little'):
+        if self._debug:
+            debug_info_header(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
+            debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
+            debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
+            debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}", debug=self._debug)
+        status = notification.COMMAND[-1]  # the command status is the last byte of the feedback
+        if status == _CMD_STARTED:
             
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED", debug=self._debug)
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}", debug=self._debug)
+            if self._debug:
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED", debug=self._debug)
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {status}", debug=self._debug)
             
             self._set_cmd_running(True)
-            if self._stall_guard is None:  # if stall_guard not running start it
+            # one stall_guard per motor lifetime, restarted only if it has ended
+            if ((self._stall_guard is None) or self._stall_guard.done()) and (self._cmd_time_to_stalled is not None):
                 self.__e_port_value_rcv.clear()
                 await self._stall_detection_init(f"{self._name}.STALL_GUARD INITIALISED", debug=self._debug)  # stall_guard now running
-                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:\tSTALL_GUARD RUNNING", debug=self._debug)
-            self._E_DETECT_STALLING.set()
+                if self._debug:
+                    debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:\tSTALL_GUARD RUNNING", debug=self._debug)
             
             self._port_free.clear()
             
-            debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                           debug=self._debug)
+            if self._debug:
+                debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
+                               debug=self._debug)
             
-        elif notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x0a', 'little'):
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: REPORTED CMD-STATUS: CMD EXECUTED",
-                       debug=self._debug)
-            debug_info(
-                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                    debug=self._debug)
+        elif status == _CMD_EXECUTED:
+            if self._debug:
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: REPORTED CMD-STATUS: CMD EXECUTED",
+                           debug=self._debug)
+                debug_info(
+                        f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {status}",
+                        debug=self._debug)
             
             self._set_cmd_running(False)
             self.__e_port_value_rcv.clear()
@@ -785,29 +846,32 @@ class SingleMotor(AMotor):
             
             # self.E_MOTOR_STALLED.clear()
             
-            debug_info_end(
-                    f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                    debug=self._debug)
+            if self._debug:
+                debug_info_end(
+                        f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
+                        debug=self._debug)
         else:
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
-                       debug=self._debug)
-            debug_info(
-                f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                debug=self._debug)
+            if self._debug:
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
+                           debug=self._debug)
+                debug_info(
+                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {status}",
+                    debug=self._debug)
 
             self._set_cmd_running(False)
             self.__e_port_value_rcv.clear()
             self.port_free.set()
             
-        debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info_footer(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
-        # self._cmd_feedback_log.append((datetime.timestamp(datetime.now()), notification.m_cmd_status))
+        if self._debug:
+            debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
+            debug_info_footer(f"<{self.name} -- {self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
+        # self._cmd_feedback_log.append((monotonic(), notification.m_cmd_status))
         self._current_cmd_feedback_notification = notification
         return True
     
     # b'\x05\x00\x82\x10\x0a'
 
-    def cmd_feedback_log(self) -> List[Tuple[float, CMD_FEEDBACK_MSG]]:
+    def cmd_feedback_log(self) -> Deque[Tuple[float, CMD_FEEDBACK_MSG]]:
         return self._cmd_feedback_log
     
     @property
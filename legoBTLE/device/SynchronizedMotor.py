@@ -8,22 +8,25 @@
 
 import asyncio
 import uuid
-from asyncio import CancelledError, Task
+from asyncio import Task
 from asyncio import Event
 from asyncio import sleep
 from asyncio.locks import Condition
 from asyncio.streams import StreamReader
 from asyncio.streams import StreamWriter
 from collections import defaultdict
-from datetime import datetime
+from collections import deque
 from time import monotonic
 from typing import Awaitable
 from typing import Callable
+from typing import Deque
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+import numpy as np
+
 from legoBTLE.device.AMotor import AMotor
 from legoBTLE.legoWP.message.downstream import CMD_GOTO_ABS_POS_DEV
 from legoBTLE.legoWP.message.downstream import CMD_SETUP_DEV_VIRTUAL_PORT
@@ -31,6 +34,7 @@ from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_DEGREES
 from legoBTLE.legoWP.message.downstream import CMD_START_MOVE_DEV_TIME
 from legoBTLE.legoWP.message.downstream import CMD_START_PWR_DEV
 from legoBTLE.legoWP.message.downstream import CMD_START_SPEED_DEV
+from legoBTLE.legoWP.message.downstream import CMD_MODE_DATA_DIRECT
 from legoBTLE.legoWP.message.downstream import DOWNSTREAM_MESSAGE
 from legoBTLE.legoWP.message.upstream import DEV_GENERIC_ERROR_NOTIFICATION
 from legoBTLE.legoWP.message.upstream import DEV_PORT_NOTIFICATION
@@ -54,6 +58,10 @@ from legoBTLE.networking.prettyprint.debug import debug_info_end
 from legoBTLE.networking.prettyprint.debug import debug_info_footer
 from legoBTLE.networking.prettyprint.debug import debug_info_header
 
+# command feedback status byte, see :class:`legoBTLE.legoWP.types.CMD_FEEDBACK_MSG`
+_CMD_STARTED: int = 0x01  # buffer empty, command in progress
+_CMD_EXECUTED: int = 0x0A  # buffer empty, command completed, port idle
+
 
 class SynchronizedMotor(AMotor):
     """This is the Synchronized Motor.
@@ -67,6 +75,22 @@ class SynchronizedMotor(AMotor):
     <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#port-output-command-feedback>`_.
     
     """
+    
+    __slots__ = ('_DEVNAME', '_E_CMD_FINISHED', '_E_CMD_STARTED', '_E_MOTOR_STALLED', '_ON_STALLED_ACTION',
+                 '__e_port_value_rcv', '_acc_dec_profiles', '_angle_cache', '_avg_speed', '_clockwise_direction',
+                 '_clockwise_direction_a', '_clockwise_direction_b', '_cmd_feedback_log', '_cmd_status',
+                 '_cmd_time_to_stalled', '_connection', '_current_cmd_feedback_notification',
+                 '_current_cmd_feedback_notification_str', '_current_profile', '_current_value', '_debug',
+                 '_degrees_cmd', '_error_notification', '_error_notification_log', '_ext_srv_connected',
+                 '_ext_srv_disconnected', '_ext_srv_notification', '_ext_srv_notification_log', '_gear_ratio',
+                 '_gear_ratio_synced', '_goto_cmd', '_hub_action', '_hub_alert', '_hub_alert_notification',
+                 '_hub_alert_notification_log', '_hub_attached_io', '_id', '_last_angle_cache', '_last_cmd_failed',
+                 '_last_cmd_snt', '_last_value', '_max_avg_speed', '_max_steering', '_measure_buf', '_measure_diff',
+                 '_measure_distance_end', '_measure_distance_start', '_motor_a', '_motor_a_port', '_motor_b',
+                 '_motor_b_port', '_name', '_port', '_port2hub_connected', '_port_connected', '_port_free',
+                 '_port_free_condition', '_power_cmd', '_server', '_set_pos_cmd', '_setup_port', '_speed_cmd',
+                 '_speed_time_cmd', '_stall_bias', '_stall_guard', '_stop_cmd', '_synced', '_time_to_stalled',
+                 '_wheel_diameter', '_wheel_diameter_synced')
 
     def __init__(self,
                  motor_a: AMotor,
@@ -105,10 +129,10 @@ class SynchronizedMotor(AMotor):
     
         self._current_cmd_feedback_notification: Optional[PORT_CMD_FEEDBACK] = None
         self._current_cmd_feedback_notification_str: Optional[str] = None
-        self._cmd_feedback_log: List[Tuple[float, CMD_FEEDBACK_MSG]] = []
+        self._cmd_feedback_log: Deque[Tuple[float, CMD_FEEDBACK_MSG]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
     
         self._hub_alert_notification: Optional[HUB_ALERT_NOTIFICATION] = None
-        self._hub_alert_notification_log: List[Tuple[float, HUB_ALERT_NOTIFICATION]] = []
+        self._hub_alert_notification_log: Deque[Tuple[float, HUB_ALERT_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
         self._hub_action = None
         self._hub_attached_io = None
         self._hub_alert: Event = Event()
@@ -165,25 +189,39 @@ class SynchronizedMotor(AMotor):
         
         self._current_value = None
         self._last_value = None
+        self._angle_cache = (None, None, None)
+        self._last_angle_cache = (None, None, None)
         self._measure_distance_start = None
         self._measure_distance_end = None
+        # fixed layout: row 0 start, row 1 end; columns (position, time) -- filled in place by measure_start/_end
+        self._measure_buf: np.ndarray = np.zeros((2, 2), dtype=np.float64)
+        self._measure_diff: np.ndarray = np.zeros(2, dtype=np.float64)
         self._avg_speed: Tuple[float, float] = (self._motor_a.avg_speed, self._motor_b.avg_speed)
         self._max_avg_speed: Tuple[float, float] = (self._motor_a.max_avg_speed, self._motor_b.max_avg_speed)
     
         self._error_notification: Optional[DEV_GENERIC_ERROR_NOTIFICATION] = None
-        self._error_notification_log: List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = []
+        self._error_notification_log: Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]] = deque(maxlen=self.NOTIFICATION_LOG_LEN)
     
         self._cmd_status = None
         self._last_cmd_snt = None
         self._last_cmd_failed = None
     
-        self._acc_dec_profiles: defaultdict = defaultdict(defaultdict)
+        self._acc_dec_profiles: dict = {}
         self._current_profile: defaultdict = defaultdict(None)
+        
+        self._stop_cmd: Optional[CMD_MODE_DATA_DIRECT] = None
+        self._set_pos_cmd: Optional[CMD_MODE_DATA_DIRECT] = None
+        self._power_cmd: Optional[Tuple[tuple, CMD_START_PWR_DEV]] = None
+        self._speed_cmd: Optional[Tuple[tuple, CMD_START_SPEED_DEV]] = None
+        self._speed_time_cmd: Optional[Tuple[tuple, CMD_START_MOVE_DEV_TIME]] = None
+        self._goto_cmd: Optional[Tuple[tuple, CMD_GOTO_ABS_POS_DEV]] = None
+        self._degrees_cmd: Optional[Tuple[tuple, CMD_START_MOVE_DEV_DEGREES]] = None
     
         self._E_MOTOR_STALLED: Event = Event()
         self._ON_STALLED_ACTION: Optional[Callable[[], Awaitable]] = None
         self._stall_bias: float = stall_bias
         self._time_to_stalled: float = time_to_stalled
+        self._cmd_time_to_stalled: Optional[float] = time_to_stalled
         self._stall_guard: Optional[Task] = None
 
         self._debug = debug
@@ -204,7 +242,7 @@ class SynchronizedMotor(AMotor):
     
     @ON_STALLED_ACTION.deleter
     def ON_STALLED_ACTION(self):
-        del self._ON_STALLED_ACTION
+        self._ON_STALLED_ACTION = None  # sentinel: no action, the attribute itself stays
         return
 
     @property
@@ -295,6 +333,33 @@ class SynchronizedMotor(AMotor):
     def port_free(self) -> Event:
         return self._port_free
     
+    async def _acquire_ports(self) -> None:
+        """Take the virtual port and the ports of both motors.
+        
+        If all three ports are free and no other task is queued at any of the gates, the check-and-clear runs
+        without an await and is therefore atomic; otherwise the caller queues at all three gates and takes the
+        ports in turn.
+        
+        This method is a coroutine.
+        
+        """
+        port_free, port_free_a, port_free_b = self._port_free, self._motor_a.port_free, self._motor_b.port_free
+        condition = self._port_free_condition
+        condition_a = self._motor_a.port_free_condition
+        condition_b = self._motor_b.port_free_condition
+        if (port_free.is_set() and port_free_a.is_set() and port_free_b.is_set()
+                and not (condition.locked() or condition_a.locked() or condition_b.locked())):
+            port_free.clear()
+            port_free_a.clear()
+            port_free_b.clear()
+            return
+        async with condition, condition_a, condition_b:
+            for port_free_event in (port_free, port_free_a, port_free_b):
+                if not port_free_event.is_set():
+                    await port_free_event.wait()
+                port_free_event.clear()
+        return
+    
     @property
     def ext_srv_notification(self) -> EXT_SERVER_NOTIFICATION:
         r"""Notification sent from the Server. More or less just raw data with certain header information.
@@ -309,12 +374,13 @@ class SynchronizedMotor(AMotor):
     
     async def ext_srv_notification_set(self, ext_srv_notification: EXT_SERVER_NOTIFICATION, debug: bool = False):
         debug = self._debug if debug is None else debug
-        debug_info_header(f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION ", debug=debug)
-        debug_info(f"PORT: {self._port[0]}", debug=debug)
+        if debug:
+            debug_info_header(f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION ", debug=debug)
+            debug_info(f"PORT: {self._port[0]}", debug=debug)
         if ext_srv_notification is not None:
             self._ext_srv_notification = ext_srv_notification
             # if self._debug:
-            #    self._ext_srv_notification_log.append((datetime.timestamp(datetime.now()), notification))
+            #    self._ext_srv_notification_log.append((monotonic(), notification))
             if ext_srv_notification.m_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED:
                 self._ext_srv_connected.set()
                 self._ext_srv_disconnected.clear()
@@ -328,11 +394,12 @@ class SynchronizedMotor(AMotor):
                 self._ext_srv_disconnected.set()
                 self._port2hub_connected.clear()
             
-            debug_info(f"EXT_SRV_CONNECTED ?:    {self._ext_srv_connected.is_set()}", debug=debug)
-            debug_info(f"EXT_SRV_DISCONNECTED ?: {self._ext_srv_disconnected.is_set()}", debug=debug)
-            debug_info(f"PORT2HUB_CONNECTED ?:   {self._port2hub_connected.is_set()}", debug=debug)
-            debug_info(f"PORT_FREE ?:            {self._port_free.is_set()}", debug=debug)
-            debug_info_footer(footer=f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION", debug=debug)
+            if debug:
+                debug_info(f"EXT_SRV_CONNECTED ?:    {self._ext_srv_connected.is_set()}", debug=debug)
+                debug_info(f"EXT_SRV_DISCONNECTED ?: {self._ext_srv_disconnected.is_set()}", debug=debug)
+                debug_info(f"PORT2HUB_CONNECTED ?:   {self._port2hub_connected.is_set()}", debug=debug)
+                debug_info(f"PORT_FREE ?:            {self._port_free.is_set()}", debug=debug)
+                debug_info_footer(footer=f"{self._name}: RECEIVED EXTERNAL_SERVER_NOTIFICATION", debug=debug)
         return
         
     @property
@@ -415,15 +482,26 @@ class SynchronizedMotor(AMotor):
         return 1.0
     
     @property
-    def measure_start(self) -> Tuple[float, float]:
-        self._measure_distance_start = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
+    def measure_start(self) -> np.ndarray:
+        buf = self._measure_buf[0]
+        buf[0] = self._current_value.m_port_value
+        buf[1] = monotonic()
+        self._measure_distance_start = buf
         return self._measure_distance_start
     
     @property
-    def measure_end(self) -> Tuple[float, float]:
-        self._measure_distance_end = (self._current_value.m_port_value, datetime.timestamp(datetime.now()))
+    def measure_end(self) -> np.ndarray:
+        buf = self._measure_buf[1]
+        buf[0] = self._current_value.m_port_value
+        buf[1] = monotonic()
+        self._measure_distance_end = buf
         return self._measure_distance_end
     
+    def _distance_start_end(self, gear_ratio=1.0) -> np.ndarray:
+        np.subtract(self.measure_end, self.measure_start, out=self._measure_diff)
+        np.divide(self._measure_diff, gear_ratio, out=self._measure_diff)
+        return self._measure_diff
+    
     async def VIRTUAL_PORT_SETUP(self, connect: bool = True) -> bool:
         """Set up two Devices as a Virtual synchronized device.
         
@@ -442,30 +520,33 @@ class SynchronizedMotor(AMotor):
         `LEGO(c): SETUP VIRTUAL PORT <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#port-output-command-feedback>`_
        
         """
+        # built before the gate, only the send has to be serialized
+        if connect:
+            command = CMD_SETUP_DEV_VIRTUAL_PORT(
+                    connection=CONNECTION.CONNECT,
+                    port_a=self._motor_a_port,
+                    port_b=self._motor_b_port, )
+        else:
+            command = CMD_SETUP_DEV_VIRTUAL_PORT(
+                    connection=CONNECTION.DISCONNECT,
+                    port=self._port, )
         
         async with self._port_free_condition:
-            print(f"IN VIRTUAL PORT SETUP... Waiting at the gates")
+            if self._debug:
+                print(f"IN VIRTUAL PORT SETUP... Waiting at the gates")
             await self._motor_a.ext_srv_connected.wait()
             await self._motor_b.ext_srv_connected.wait()
             # await self._port_free.wait()
             self._port_free.clear()
             # self._motor_a.port_free.clear()
             # self._motor_b.port_free.clear()
-            print(f"IN VIRTUAL PORT SETUP... PASSED the gates")
-            if connect:
-                command = CMD_SETUP_DEV_VIRTUAL_PORT(
-                        connection=CONNECTION.CONNECT,
-                        port_a=self._motor_a_port,
-                        port_b=self._motor_b_port, )
-            else:
-                command = CMD_SETUP_DEV_VIRTUAL_PORT(
-                        connection=CONNECTION.DISCONNECT,
-                        port=self._port, )
-            print(f"IN VIRTUAL PORT SETUP... SENDING")
+            if self._debug:
+                print(f"IN VIRTUAL PORT SETUP... PASSED the gates")
+                print(f"IN VIRTUAL PORT SETUP... SENDING")
             s = await self._cmd_send(command)
-            self._port_free.set()
-            self._port_free_condition.notify_all()
-        print(f"IN VIRTUAL PORT SETUP... SENDING DONE")
+            self._release_port()
+        if self._debug:
+            print(f"IN VIRTUAL PORT SETUP... SENDING DONE")
         return s
 
     async def START_SPEED_UNREGULATED_SYNCED(
@@ -520,11 +601,10 @@ class SynchronizedMotor(AMotor):
         <https://lego.github.io/lego-ble-wireless-protocol-docs/index.html#output-sub-command-startspeed-speed1-speed2-maxpower-useprofile-0x08>`_
         
         """
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         cmd_debug = self._debug if cmd_debug is None else cmd_debug
         
-        _wcd = None
         
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value * self._motor_a.clockwise_direction  # normalize speed
@@ -548,65 +628,63 @@ class SynchronizedMotor(AMotor):
                 use_dec_profile=use_dec_profile,
                 )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=cmd_debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
-                debug=cmd_debug)
-        async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            await self._motor_a.port_free.wait()
-            self._motor_a.port_free.clear()
-            await self._motor_b.port_free.wait()
-            self._motor_b.port_free.clear()
-            self._E_CMD_FINISHED.clear()
-            
+        if cmd_debug:
+            debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=cmd_debug)
+            debug_info_begin(
+                    f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
+                    debug=cmd_debug)
+        await self._acquire_ports()
+        self._E_CMD_FINISHED.clear()
+        
+        if cmd_debug:
             debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
                            debug=cmd_debug)
-            
-            if delay_before is not None:
+        
+        if delay_before:
+            if cmd_debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
                         debug=cmd_debug)
-                await sleep(delay_before)
+            await sleep(delay_before)
+            if cmd_debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
                         debug=cmd_debug)
-            
+        
+        if cmd_debug:
             debug_info_begin(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=cmd_debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-            
-            s = await self._cmd_send(command)
+        # _wait_until part
+        if wait_cond:
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
+        
+        s = await self._cmd_send(command)
 
-            t0 = monotonic()
+        t0 = monotonic()
+        if cmd_debug:
             debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=cmd_debug)
-            await self.E_CMD_FINISHED.wait()
+        await self.E_CMD_FINISHED.wait()
+        if cmd_debug:
             debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=cmd_debug)
-            
+        
             debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # CMD: {command}",
                        debug=cmd_debug)
             debug_info_end(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=cmd_debug)
-            
-            if delay_after is not None:
+        
+        if delay_after:
+            if cmd_debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
                         debug=cmd_debug)
-                await sleep(delay_after)
+            await sleep(delay_after)
+            if cmd_debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
                         debug=cmd_debug)
 
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=cmd_debug)
+        if cmd_debug:
+            debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=cmd_debug)
         return s
 
     async def START_POWER_UNREGULATED_SYNCED(self,
@@ -650,12 +728,11 @@ class SynchronizedMotor(AMotor):
         :class:`legoWP.types.MOVEMENT`
         """
 
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
         debug = self._debug if debug is None else debug
         
-        _wcd = None
 
         power_a *= self._clockwise_direction_a  # normalize power motor A
         power_b *= self._clockwise_direction_b  # normalize power motor B
@@ -669,65 +746,64 @@ class SynchronizedMotor(AMotor):
                 completion_cond=MOVEMENT.ONCOMPLETION_UPDATE_STATUS,
                 )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=debug)
-        debug_info_begin(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
-                         debug=debug)
-        async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            await self._motor_a.port_free.wait()
-            self._motor_a.port_free.clear()
-            await self._motor_b.port_free.wait()
-            self._motor_b.port_free.clear()
-            self._E_CMD_FINISHED.clear()
-            
+        if debug:
+            debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED_SYNCED", debug=debug)
+            debug_info_begin(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # WAITING AT THE GATES",
+                             debug=debug)
+        await self._acquire_ports()
+        self._E_CMD_FINISHED.clear()
+        
+        if debug:
             debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # PASSED THE GATES",
                            debug=debug)
-            
-            if delay_before is not None:
+        
+        if delay_before:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
                         debug=debug)
-                await sleep(delay_before)
+            await sleep(delay_before)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED_SYNCED # delay_before {delay_before}s",
                         debug=debug)
-            
+        
+        if debug:
             debug_info_begin(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-            
-            s = await self._cmd_send(command)
-            
+        # _wait_until part
+        if wait_cond:
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
+        
+        s = await self._cmd_send(command)
+        
+        if debug:
             debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # CMD: {command}",
                        debug=debug)
             debug_info_end(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # sending CMD", debug=debug)
 
-            t0 = monotonic()
+        t0 = monotonic()
+        if debug:
             debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
-            await self.E_CMD_FINISHED.wait()
+        await self.E_CMD_FINISHED.wait()
+        if debug:
             debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
 
-            if delay_after is not None:
+        if delay_after:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
                         debug=debug)
-                await sleep(delay_after)
+            await sleep(delay_after)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_POWER_UNREGULATED # delay_after {delay_after}s",
                         debug=debug)
 
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
     
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=debug)
+        if debug:
+            debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_POWER_UNREGULATED", debug=debug)
         return s
     
     @property
@@ -756,11 +832,11 @@ class SynchronizedMotor(AMotor):
     
     async def error_notification_set(self, error: DEV_GENERIC_ERROR_NOTIFICATION):
         self._error_notification = error
-        self._error_notification_log.append((datetime.timestamp(datetime.now()), error))
+        self._error_notification_log.append((monotonic(), error))
         return
     
     @property
-    def error_notification_log(self) -> List[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
+    def error_notification_log(self) -> Deque[Tuple[float, DEV_GENERIC_ERROR_NOTIFICATION]]:
         return self._error_notification_log
     
     @property
@@ -777,9 +853,11 @@ class SynchronizedMotor(AMotor):
     
     async def hub_attached_io_notification_set(self, io_notification: HUB_ATTACHED_IO_NOTIFICATION):
         former_port = self._port
-        debug_info_header(f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
+        if self._debug:
+            debug_info_header(f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
         if io_notification.m_io_event == PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED:
-            debug_info(f"PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED}", debug=self._debug)
+            if self._debug:
+                debug_info(f"PERIPHERAL_EVENT.VIRTUAL_IO_ATTACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.EXT_SRV_CONNECTED}", debug=self._debug)
             
             self._hub_attached_io = io_notification
             self._port = io_notification.m_port
@@ -793,7 +871,8 @@ class SynchronizedMotor(AMotor):
             self._port_free.set()
         
         elif io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED:
-            debug_info(f"PERIPHERAL_EVENT.IO_DETACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED}", debug=self._debug)
+            if self._debug:
+                debug_info(f"PERIPHERAL_EVENT.IO_DETACHED?: {io_notification.m_io_event == PERIPHERAL_EVENT.IO_DETACHED}", debug=self._debug)
             
             self._port_connected.clear()
             self._ext_srv_connected.clear()
@@ -801,15 +880,16 @@ class SynchronizedMotor(AMotor):
             self._port2hub_connected.clear()
             self._port_free.clear()
         
-        debug_info(f"FORMER PORT: {int.from_bytes(former_port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"NEW VIRTUAL PORT: {int.from_bytes(self._port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"PORT A: {int.from_bytes(self._motor_a.port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"PORT B: {int.from_bytes(self._motor_b.port, 'little', signed=False)}", debug=self._debug)
-        debug_info(f"EXT_SRV_CONNECTED?:    {self._ext_srv_connected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"EXT_SRV_DISCONNECTED?: {self._ext_srv_disconnected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"PORT2HUB_CONNECTED?:   {self._port2hub_connected.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info(f"PORT_FREE?:            {self._port_free.is_set()}{C.ENDC}", debug=self._debug)
-        debug_info_footer(footer=f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
+        if self._debug:
+            debug_info(f"FORMER PORT: {int.from_bytes(former_port, 'little', signed=False)}", debug=self._debug)
+            debug_info(f"NEW VIRTUAL PORT: {int.from_bytes(self._port, 'little', signed=False)}", debug=self._debug)
+            debug_info(f"PORT A: {int.from_bytes(self._motor_a.port, 'little', signed=False)}", debug=self._debug)
+            debug_info(f"PORT B: {int.from_bytes(self._motor_b.port, 'little', signed=False)}", debug=self._debug)
+            debug_info(f"EXT_SRV_CONNECTED?:    {self._ext_srv_connected.is_set()}{C.ENDC}", debug=self._debug)
+            debug_info(f"EXT_SRV_DISCONNECTED?: {self._ext_srv_disconnected.is_set()}{C.ENDC}", debug=self._debug)
+            debug_info(f"PORT2HUB_CONNECTED?:   {self._port2hub_connected.is_set()}{C.ENDC}", debug=self._debug)
+            debug_info(f"PORT_FREE?:            {self._port_free.is_set()}{C.ENDC}", debug=self._debug)
+            debug_info_footer(footer=f"VIRTUAL PORT {self._port[0]}: HUB_ATTACHED_IO_NOTIFICATION:", debug=self._debug)
         return
     
     @property
@@ -831,11 +911,11 @@ class SynchronizedMotor(AMotor):
         return
     
     @property
-    def acc_dec_profiles(self) -> defaultdict:
+    def acc_dec_profiles(self) -> dict:
         return self._acc_dec_profiles
     
     @acc_dec_profiles.setter
-    def acc_dec_profiles(self, profiles: defaultdict):
+    def acc_dec_profiles(self, profiles: dict):
         self._acc_dec_profiles = profiles
         return
 
@@ -868,12 +948,11 @@ class SynchronizedMotor(AMotor):
             wait_cond_timeout: float = None,
             debug: Optional[bool] = None,
             ):
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
         debug = self._debug if debug is None else debug
         
-        _wcd = None
         
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value * self._clockwise_direction_a  # normalize speed motor A
@@ -899,65 +978,64 @@ class SynchronizedMotor(AMotor):
                 use_acc_profile=use_acc_profile,
                 use_dec_profile=use_dec_profile, )
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # WAITING AT THE GATES",
-                debug=debug)
-        async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            await self._motor_a.port_free.wait()
-            self._motor_a.port_free.clear()
-            await self._motor_b.port_free.wait()
-            self._motor_b.port_free.clear()
-            self._E_CMD_FINISHED.clear()
+        if debug:
+            debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
+            debug_info_begin(
+                    f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # WAITING AT THE GATES",
+                    debug=debug)
+        await self._acquire_ports()
+        self._E_CMD_FINISHED.clear()
         
+        if debug:
             debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # PASSED THE GATES",
                            debug=debug)
         
-            if delay_before is not None:
+        if delay_before:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {delay_before}s",
                         debug=debug)
-                await sleep(delay_before)
+            await sleep(delay_before)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_before {delay_before}s",
                         debug=debug)
-            
+        
+        if debug:
             debug_info_begin(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD", debug=debug)
         
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
+        # _wait_until part
+        if wait_cond:
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
         
-            s = await self._cmd_send(command)
+        s = await self._cmd_send(command)
         
+        if debug:
             debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # CMD: {command}",
                        debug=debug)
             debug_info_end(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # sending CMD", debug=debug)
         
-            t0 = monotonic()
+        t0 = monotonic()
+        if debug:
             debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
-            await self.E_CMD_FINISHED.wait()
+        await self.E_CMD_FINISHED.wait()
+        if debug:
             debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
         
-            if delay_after is not None:
+        if delay_after:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {delay_after}s",
                         debug=debug)
-                await sleep(delay_after)
+            await sleep(delay_after)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_MOVE_DEGREES_SYNCED # delay_after {delay_after}s",
                         debug=debug)
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
+        if debug:
+            debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_MOVE_DEGREES_SYNCED", debug=debug)
         return s
 
     async def START_SPEED_TIME_SYNCED(
@@ -1020,11 +1098,10 @@ class SynchronizedMotor(AMotor):
             True if all is good, False otherwise.
             
         """
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         debug = self._debug if debug is None else debug
         
-        _wcd = None
         
         if isinstance(speed_a, DIRECTIONAL_VALUE):
             _speed_a = speed_a.value
@@ -1055,63 +1132,63 @@ class SynchronizedMotor(AMotor):
         
         _cmd_id = self.START_SPEED_TIME_SYNCED.__qualname__ if cmd_id is None else cmd_id
 
-        debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
-        debug_info_begin(
-                f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # WAITING AT THE GATES",
-                debug=debug)
-        async with self.port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
-            await self._port_free.wait()
-            self._port_free.clear()
-            await self._motor_a.port_free.wait()
-            self._motor_a.port_free.clear()
-            await self._motor_b.port_free.wait()
-            self._motor_b.port_free.clear()
-            self._E_CMD_FINISHED.clear()
+        if debug:
+            debug_info_header(f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
+            debug_info_begin(
+                    f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # WAITING AT THE GATES",
+                    debug=debug)
+        await self._acquire_ports()
+        self._E_CMD_FINISHED.clear()
+        if debug:
             debug_info_end(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # PASSED THE GATES",
                            debug=debug)
-            
-            if delay_before is not None:
+        
+        if delay_before:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_before {delay_before}s",
                         debug=debug)
-                await sleep(delay_before)
+            await sleep(delay_before)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_before {delay_before}s",
                         debug=debug)
         
+        if debug:
             debug_info_begin(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # sending CMD", debug=debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-            
-            s = await self._cmd_send(command)
-            
+        # _wait_until part
+        if wait_cond:
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
+        
+        s = await self._cmd_send(command)
+        
+        if debug:
             debug_info(f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # CMD: {command}",
                        debug=debug)
             debug_info_end(
                     f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # sending CMD", debug=debug)
-            
-            t0 = monotonic()
+        
+        t0 = monotonic()
+        if debug:
             debug_info(f"WAITING FOR COMMAND END: t0={t0}s", debug=debug)
-            await self.E_CMD_FINISHED.wait()
+        await self.E_CMD_FINISHED.wait()
+        if debug:
             debug_info(f"WAITED {monotonic() - t0}s FOR COMMAND TO END...", debug=debug)
 
-            if delay_after is not None:
+        if delay_after:
+            if debug:
                 debug_info_begin(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_after {delay_after}s",
                         debug=debug)
-                await sleep(delay_after)
+            await sleep(delay_after)
+            if debug:
                 debug_info_end(
                         f"NAME: {self.name} / PORT: {self.port[0]} / START_SPEED_TIME_SYNCED # delay_after {delay_after}s",
                         debug=debug)
 
-        try:
-            _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
+        if debug:
+            debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # START_SPEED_TIME_SYNCED", debug=debug)
         return s
     
     async def GOTO_ABS_POS_SYNCED(self,
@@ -1173,12 +1250,11 @@ class SynchronizedMotor(AMotor):
             
         """
         
-        self.time_to_stalled = time_to_stalled
+        self._cmd_time_to_stalled = self.time_to_stalled if time_to_stalled is None else time_to_stalled
         self.ON_STALLED_ACTION = on_stalled
         
         debug = self._debug if debug is None else debug
 
-        _wcd = None
         if isinstance(speed, DIRECTIONAL_VALUE):
             _speed = speed.value
         else:
@@ -1202,55 +1278,54 @@ class SynchronizedMotor(AMotor):
                 use_dec_profile=use_dec_profile,
                 )
 
-        debug_info_header(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]", debug=self.debug)
-        debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: AT THE GATES >> >> >> WAITING", debug=self.debug)
-        async with self._port_free_condition, self._motor_a.port_free_condition, self._motor_b.port_free_condition:
-            await self.port_free.wait()
-            self.port_free.clear()
-            await self._motor_a.port_free.wait()
-            self._motor_a.port_free.clear()
-            await self._motor_b.port_free.wait()
-            self._motor_b.port_free.clear()
-            self._set_cmd_running(False)
+        if self.debug:
+            debug_info_header(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]", debug=self.debug)
+            debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: AT THE GATES >> >> >> WAITING", debug=self.debug)
+        await self._acquire_ports()
+        self._set_cmd_running(False)
+        if self.debug:
             debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: AT THE GATES >> >> >> PASSED THE GATES",
                              debug=self.debug)
-            
-            if delay_before is not None:
+        
+        if delay_before:
+            if self.debug:
                 debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  DELAY_BEFORE >> >> >> WAITING FOR", debug=self.debug)
-                
-                await sleep(delay_before)
-                
+            
+            await sleep(delay_before)
+            
+            if self.debug:
                 debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  DELAY_BEFORE >> >> >> WAITING DONE", debug=self.debug)
-                
+            
+        if debug:
             debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  >> >> >> sending CMD {command.COMMAND.hex()}", debug=debug)
-            # _wait_until part
-            if wait_cond:
-                _wcd = asyncio.create_task(self._on_wait_cond_do(wait_cond=wait_cond))
-                await asyncio.wait({_wcd}, timeout=wait_cond_timeout)
-                
-            s = await self._cmd_send(command)
+        # _wait_until part
+        if wait_cond:
+            await self._on_wait_cond_do(wait_cond=wait_cond, timeout=wait_cond_timeout)
+            
+        s = await self._cmd_send(command)
 
+        if debug:
             debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]:  >> >> >> DONE sending CMD {command.COMMAND.hex()}",
                            debug=debug)
-            
-            t0 = monotonic()
+        
+        t0 = monotonic()
+        if debug:
             debug_info_begin(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: t0={t0}s", debug=debug)
-            await self.E_CMD_FINISHED.wait()
+        await self.E_CMD_FINISHED.wait()
+        if debug:
             debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: WAITED {monotonic() - t0}s FOR COMMAND TO END", debug=debug)
-            
-            if delay_after is not None:
+        
+        if delay_after:
+            if debug:
                 debug_info_begin(
                         f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: DELAY_AFTER >> >> >> WAITING {delay_after}s",
                         debug=debug)
-                await sleep(delay_after)
+            await sleep(delay_after)
+            if debug:
                 debug_info_end(f"{self.GOTO_ABS_POS_SYNCED.__name__} +*+ [{self._name}:{self.port}]: DELAY_AFTER >> >> >> WAITING DONE {delay_after}s", debug=debug)
-                
-        try:
-            if _wcd is not None:
-                _wcd.cancel()
-        except (CancelledError, AttributeError):
-            pass
-        debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # CMD_GOTO_ABS_POS_DEV", debug=debug)
+            
+        if debug:
+            debug_info_footer(footer=f"NAME: {self.name} / PORT: {self.port[0]} # CMD_GOTO_ABS_POS_DEV", debug=debug)
         return s
     
     @property
@@ -1258,61 +1333,69 @@ class SynchronizedMotor(AMotor):
         return self._current_cmd_feedback_notification
     
     async def cmd_feedback_notification_set(self, notification: PORT_CMD_FEEDBACK):
-        debug_info_header(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
-        debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
-        debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}",
-                   debug=self._debug)
+        if self._debug:
+            debug_info_header(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK", debug=self._debug)
+            debug_info_begin(f"<{self.name}:{self.port[0]}> - CMD_FEEDBACK: NOTIFICATION-MSG-DETAILS", debug=self._debug)
+            debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: PORT: {notification.m_port[0]}", debug=self._debug)
+            debug_info(f"<{self.name}:{self.port[0]}> - <CMD_FEEDBACK]: MSG_CONTENT: {notification.COMMAND.hex()}",
+                       debug=self._debug)
         
-        if notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x01', 'little'):
+        status = notification.COMMAND[-1]  # the command status is the last byte of the feedback
+        if status == _CMD_STARTED:
         
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED",
-                       debug=self._debug)
-            debug_info(
-                f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                debug=self._debug)
+            if self._debug:
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS: CMD STARTED",
+                           debug=self._debug)
+                debug_info(
+                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]: CMD-STATUS CODE: {status}",
+                    debug=self._debug)
         
             self._set_cmd_running(True)
             self._port_free.clear()
             self._motor_a.port_free.clear()
             self._motor_b.port_free.clear()
             
-            debug_info_end(
-                f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                debug=self._debug)
+            if self._debug:
+                debug_info_end(
+                    f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
+                    debug=self._debug)
 
-        elif notification.COMMAND[len(notification.COMMAND) - 1] == int.from_bytes(b'\x0a', 'little'):
-            debug_info(f"PORT {notification.m_port[0]}: RECEIVED CMD_STATUS: CMD FINISHED ", debug=self._debug)
-            debug_info(f"STATUS: {notification.COMMAND[len(notification.COMMAND) - 1]}", debug=self._debug)
+        elif status == _CMD_EXECUTED:
+            if self._debug:
+                debug_info(f"PORT {notification.m_port[0]}: RECEIVED CMD_STATUS: CMD FINISHED ", debug=self._debug)
+                debug_info(f"STATUS: {status}", debug=self._debug)
             
             self._set_cmd_running(False)
             self._port_free.set()
             self._motor_a.port_free.set()
             self._motor_b.port_free.set()
 
-            debug_info_end(
-                    f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
-                    debug=self._debug)
+            if self._debug:
+                debug_info_end(
+                        f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS:{notification.m_port[0]}",
+                        debug=self._debug)
         else:
-            debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
-                       debug=self._debug)
-            debug_info(
-                    f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {notification.COMMAND[len(notification.COMMAND) - 1]}",
-                    debug=self._debug)
+            if self._debug:
+                debug_info(f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:REPORTED CMD-STATUS: CMD DISCARDED",
+                           debug=self._debug)
+                debug_info(
+                        f"[{self.name}:{notification.m_port[0]}]-[CMD_FEEDBACK]:CMD-STATUS CODE: {status}",
+                        debug=self._debug)
             
             self._set_cmd_running(False)
             self._port_free.set()
             self._motor_a.port_free.set()
             self._motor_b.port_free.set()
 
-        debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
-        debug_info_footer(f"<{self.name}:{self.port[0]}> -[CMD_FEEDBACK]", debug=self._debug)
-        self._cmd_feedback_log.append((datetime.timestamp(datetime.now()), notification.m_cmd_status))
+        if self._debug:
+            debug_info_end(f"[{self.name}:{self.port[0]}]-[CMD_FEEDBACK]: NOTIFICATION-MSG-DETAILS", debug=self._debug)
+            debug_info_footer(f"<{self.name}:{self.port[0]}> -[CMD_FEEDBACK]", debug=self._debug)
+        self._cmd_feedback_log.append((monotonic(), notification.m_cmd_status))
         self._current_cmd_feedback_notification = notification
         return
     
     @property
-    def cmd_feedback_log(self) -> List[Tuple[float, CMD_FEEDBACK_MSG]]:
+    def cmd_feedback_log(self) -> Deque[Tuple[float, CMD_FEEDBACK_MSG]]:
         return self._cmd_feedback_log
     
     @property
@@ -1330,7 +1413,8 @@ class SynchronizedMotor(AMotor):
     def connection_set(self, connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> None:
         self._ext_srv_connected.set()
         self._connection = connection
-        debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: RECEIVED CONNECTION", debug=self._debug)
+        if self._debug:
+            debug_info(f"[{self._name}:{self._port[0]}]-[MSG]: RECEIVED CONNECTION", debug=self._debug)
         return
     
     @property
@@ -1343,14 +1427,14 @@ class SynchronizedMotor(AMotor):
     
     async def hub_alert_notification_set(self, notification: HUB_ALERT_NOTIFICATION):
         self._hub_alert_notification = notification
-        self._hub_alert_notification_log.append((datetime.timestamp(datetime.now()), notification))
+        self._hub_alert_notification_log.append((monotonic(), notification))
         self._hub_alert.set()
         if notification.hub_alert_status == ALERT_STATUS.ALERT:
             raise ResourceWarning(f"Hub Alert Received: {notification.hub_alert_type_str}")
         return
     
     @property
-    def hub_alert_notification_log(self) -> List[Tuple[float, HUB_ALERT_NOTIFICATION]]:
+    def hub_alert_notification_log(self) -> Deque[Tuple[float, HUB_ALERT_NOTIFICATION]]:
         return self._hub_alert_notification_log
     
     @property
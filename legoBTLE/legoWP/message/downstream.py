@@ -14,13 +14,12 @@
 
 # UPS == UPSTREAM === FROM DEVICE
 # DNS == DOWNSTREAM === TO DEVICE
+import struct
 import uuid
 from dataclasses import dataclass
 from dataclasses import field
 from typing import Union
 
-import bitstring
-
 from legoBTLE.legoWP.types import COMMAND_STATUS
 from legoBTLE.legoWP.types import CONNECTION
 from legoBTLE.legoWP.types import HUB_ACTION
@@ -35,6 +34,14 @@ from legoBTLE.legoWP.types import SERVER_SUB_COMMAND
 from legoBTLE.legoWP.types import SUB_COMMAND
 from legoBTLE.legoWP.types import WRITEDIRECT_MODE
 
+# Precompiled little-endian field formats for the command payloads.
+_INT8 = struct.Struct('<b')
+_UINT8 = struct.Struct('<B')
+_UINT16 = struct.Struct('<H')
+_INT32 = struct.Struct('<i')
+# port number -> port byte; a missing key is a port outside 0..255, as int.to_bytes would have rejected it
+_PORT_BYTES = {port: bytes((port,)) for port in range(256)}
+
 
 @dataclass
 class CMD_COMMON_MESSAGE_HEADER:
@@ -77,7 +84,7 @@ class CMD_SET_ACC_DEACC_PROFILE(DOWNSTREAM_MESSAGE):
             if isinstance(self.port, PORT):
                 self.port: bytes = self.port.value
             elif isinstance(self.port, int):
-                self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+                self.port: bytes = _PORT_BYTES[self.port]
             else:
                 self.port: bytes = self.port
             
@@ -85,7 +92,7 @@ class CMD_SET_ACC_DEACC_PROFILE(DOWNSTREAM_MESSAGE):
             self.COMMAND: bytearray = bytearray(
                     self.header +
                     self.port +
-                    bitstring.Bits(uintle=(self.start_cond & self.completion_cond), length=8).bytes +
+                    _UINT8.pack(self.start_cond & self.completion_cond) +
                     self.profile_type +
                     self.time_to_full_zero_speed.to_bytes(2, 'little', signed=False) +
                     self.profile_nr.to_bytes(1, 'little', signed=False)
@@ -112,7 +119,7 @@ class CMD_EXT_SRV_CONNECT_REQ(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         elif isinstance(self.port, bytes):
             pass
         else:
@@ -122,7 +129,7 @@ class CMD_EXT_SRV_CONNECT_REQ(DOWNSTREAM_MESSAGE):
                         + self.port
                         + self.subCMD)
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -148,7 +155,7 @@ class CMD_EXT_SRV_DISCONNECT_REQ(DOWNSTREAM_MESSAGE):
         
         self.COMMAND = self.header + self.port + self.subCMD
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -169,7 +176,7 @@ class EXT_SRV_CONNECTED_SND(DOWNSTREAM_MESSAGE):
         
         self.COMMAND = self.header + self.port + PERIPHERAL_EVENT.EXT_SRV_CONNECTED
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -190,7 +197,7 @@ class EXT_SRV_DISCONNECTED_SND(DOWNSTREAM_MESSAGE):
         
         self.COMMAND = self.header + self.port + PERIPHERAL_EVENT.EXT_SRV_DISCONNECTED
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -210,7 +217,7 @@ class CMD_HUB_ACTION_HUB_SND(DOWNSTREAM_MESSAGE):
         self.header: bytearray = CMD_COMMON_MESSAGE_HEADER(MESSAGE_TYPE.UPS_DNS_HUB_ACTION[:1]).header
         self.COMMAND = self.header + bytearray(self.hub_action)
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -236,7 +243,7 @@ class HUB_ALERT_UPDATE_REQ(DOWNSTREAM_MESSAGE):
                 self.hub_alert_op
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -262,7 +269,7 @@ class HUB_ALERT_NOTIFICATION_REQ(DOWNSTREAM_MESSAGE):
                 self.hub_alert_op
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -295,7 +302,7 @@ class CMD_PORT_NOTIFICATION_DEV_REQ(DOWNSTREAM_MESSAGE):
                                  b'\x00' * (4 - len(self.delta_interval)) +
                                  self.notif_enabled)
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -347,28 +354,28 @@ class CMD_START_PWR_DEV(DOWNSTREAM_MESSAGE):
         ports = [self.port, ]
         ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
         [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
+                map(lambda x: _PORT_BYTES[x] if isinstance(x, int) else x, ports))
         
         self.COMMAND: bytearray = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(uintle=(self.start_cond & self.completion_cond), length=8).bytes
+                _UINT8.pack(self.start_cond & self.completion_cond)
                 )
                 
         if self.synced:
             self.COMMAND += bytearray(
                     SUB_COMMAND.START_PWR_UNREGULATED_SYNC +
                     (
-                            bitstring.Bits(intle=(self.power_a), length=8).bytes +
-                            bitstring.Bits(intle=(self.power_b), length=8).bytes
+                            _INT8.pack(self.power_a) +
+                            _INT8.pack(self.power_b)
                         )
                     )
-            self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+            self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         else:
             self.COMMAND += bytearray(
-                    bitstring.Bits(intle=(self.power), length=8).bytes
+                    _INT8.pack(self.power)
                     )
-            self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+            self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
 
         self.COMMAND: bytearray = bytearray(
                 self.handle +
@@ -421,32 +428,31 @@ class CMD_START_SPEED_DEV(DOWNSTREAM_MESSAGE):
         ports = [self.port, ]
         ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
         [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
+                map(lambda x: _PORT_BYTES[x] if isinstance(x, int) else x, ports))
         
         if self.synced:
             self.subCmd: bytes = SUB_COMMAND.TURN_SPD_UNLIMITED_SYNC
             maxSpdEff_CCWCW: bytearray = bytearray(
-                    bitstring.Bits(intle=(self.speed_a), length=8).bytes +
-                    bitstring.Bits(intle=(self.speed_b), length=8).bytes
+                    _INT8.pack(self.speed_a) +
+                    _INT8.pack(self.speed_b)
                     )
         else:
             self.subCmd: bytes = SUB_COMMAND.TURN_SPD_UNLIMITED
             maxSpdEff_CCWCW: bytearray = bytearray(
-                    bitstring.Bits(intle=(self.speed), length=8).bytes
+                    _INT8.pack(self.speed)
                     )
         
         self.COMMAND: bytearray = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
+                _INT8.pack(self.start_cond & self.completion_cond) +
                 self.subCmd +
                 maxSpdEff_CCWCW +
-                bitstring.Bits(uintle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
+                _UINT8.pack(self.abs_max_power) +
+                _UINT8.pack((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile)
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND: bytearray = bytearray(
                 self.handle +
@@ -481,36 +487,35 @@ class CMD_START_MOVE_DEV_TIME(DOWNSTREAM_MESSAGE):
         ports = [self.port, ]
         ports = list(map(lambda x: x.value if isinstance(x, PORT) else x, ports))
         [self.port, ] = list(
-                map(lambda x: x.to_bytes(1, 'little', signed=False) if isinstance(x, int) else x, ports))
+                map(lambda x: _PORT_BYTES[x] if isinstance(x, int) else x, ports))
         
         self.subCMD: bytes
         speedEff: bytes
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_TIME_SYNC
             speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed_a, length=8).bytes +
-                    bitstring.Bits(intle=self.speed_b, length=8).bytes
+                    _INT8.pack(self.speed_a) +
+                    _INT8.pack(self.speed_b)
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_TIME
             speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed, length=8).bytes
+                    _INT8.pack(self.speed)
                     )
         
         self.COMMAND = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
+                _INT8.pack(self.start_cond & self.completion_cond) +
                 self.subCMD +
-                bitstring.Bits(uintle=self.time, length=16).bytes +
+                _UINT16.pack(self.time) +
                 speedEff +
-                bitstring.Bits(uintle=self.power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
+                _UINT8.pack(self.power) +
+                _INT8.pack(self.on_completion) +
+                _UINT8.pack((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile)
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(self.handle +
                                  self.m_length +
@@ -547,7 +552,7 @@ class CMD_START_MOVE_DEV_DEGREES(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         else:
             self.port: bytes = self.port
             
@@ -555,8 +560,8 @@ class CMD_START_MOVE_DEV_DEGREES(DOWNSTREAM_MESSAGE):
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_DEGREES_SYNC
             speedEff: bytearray = bytearray(
-                    bitstring.Bits(intle=self.speed_a, length=8).bytes +
-                    bitstring.Bits(intle=self.speed_b, length=8).bytes
+                    _INT8.pack(self.speed_a) +
+                    _INT8.pack(self.speed_b)
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.TURN_FOR_DEGREES
@@ -571,17 +576,16 @@ class CMD_START_MOVE_DEV_DEGREES(DOWNSTREAM_MESSAGE):
         self.COMMAND = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
+                _INT8.pack(self.start_cond & self.completion_cond) +
                 self.subCMD +
-                bitstring.Bits(intle=self.degrees, length=32).bytes +
+                _INT32.pack(self.degrees) +
                 speedEff +
-                bitstring.Bits(intle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(uintle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
+                _INT8.pack(self.abs_max_power) +
+                _INT8.pack(self.on_completion) +
+                _UINT8.pack((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile)
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(self.handle
                                  + self.m_length
@@ -654,35 +658,34 @@ class CMD_GOTO_ABS_POS_DEV(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         else:
             self.port: bytes = self.port
         
         if self.synced:
             self.subCMD: bytes = SUB_COMMAND.GOTO_ABSOLUTE_POS_SYNC
             absPosEff: bytearray = bytearray(
-                    bitstring.Bits(intle=(int(round(self.abs_pos_a * self.gearRatio))), length=32).bytes +
-                    bitstring.Bits(intle=(int(round(self.abs_pos_b * self.gearRatio))), length=32).bytes
+                    _INT32.pack(int(round(self.abs_pos_a * self.gearRatio))) +
+                    _INT32.pack(int(round(self.abs_pos_b * self.gearRatio)))
                     )
         else:
             self.subCMD: bytes = SUB_COMMAND.GOTO_ABSOLUTE_POS
             absPosEff: bytearray = bytearray(
-                    bitstring.Bits(intle=(int(round(self.abs_pos * self.gearRatio))), length=32).bytes
+                    _INT32.pack(int(round(self.abs_pos * self.gearRatio)))
                     )
         self.COMMAND = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
+                _INT8.pack(self.start_cond & self.completion_cond) +
                 self.subCMD +
                 absPosEff +
-                bitstring.Bits(intle=self.speed, length=8).bytes +
-                bitstring.Bits(intle=self.abs_max_power, length=8).bytes +
-                bitstring.Bits(intle=self.on_completion, length=8).bytes +
-                bitstring.Bits(intle=((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile),
-                               length=8).bytes
+                _INT8.pack(self.speed) +
+                _INT8.pack(self.abs_max_power) +
+                _INT8.pack(self.on_completion) +
+                _INT8.pack((self.use_profile << 2) + self.use_acc_profile + self.use_dec_profile)
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(
                 self.handle +
@@ -718,11 +721,11 @@ class CMD_SETUP_DEV_VIRTUAL_PORT(DOWNSTREAM_MESSAGE):
             self.port: bytes = self.port.value
 
         if isinstance(self.port_a, int):
-            self.port_a: bytes = int.to_bytes(self.port_a, 1, 'little', signed=False)
+            self.port_a: bytes = _PORT_BYTES[self.port_a]
         if isinstance(self.port_b, int):
-            self.port_b: bytes = int.to_bytes(self.port_b, 1, 'little', signed=False)
+            self.port_b: bytes = _PORT_BYTES[self.port_b]
         if isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, 1, 'little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
             
         self.COMMAND = bytearray(
                 self.header +
@@ -741,7 +744,7 @@ class CMD_SETUP_DEV_VIRTUAL_PORT(DOWNSTREAM_MESSAGE):
                     self.port
                     )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(self.handle +
                                  self.m_length +
@@ -792,20 +795,20 @@ class CMD_SET_POSITION_L_R(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         else:
             self.port: bytes = self.port
         
         self.COMMAND: bytearray = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(start_cond & completion_cond), length=8).bytes +
+                _INT8.pack(start_cond & completion_cond) +
                 self.sub_cmd +
-                bitstring.Bits(intle=self.dev_value_a, length=32).bytes +
-                bitstring.Bits(intle=self.dev_value_b, length=32).bytes
+                _INT32.pack(self.dev_value_a) +
+                _INT32.pack(self.dev_value_b)
                 )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(self.handle +
                                  self.m_length +
@@ -854,14 +857,14 @@ class CMD_MODE_DATA_DIRECT(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         else:
             self.port: bytes = self.port
         
         self.COMMAND: bytearray = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(self.start_cond & self.completion_cond), length=8).bytes +
+                _INT8.pack(self.start_cond & self.completion_cond) +
                 self.sub_cmd +
                 self.preset_mode
                 )
@@ -869,41 +872,40 @@ class CMD_MODE_DATA_DIRECT(DOWNSTREAM_MESSAGE):
         if self.preset_mode == WRITEDIRECT_MODE.SET_LED_RGB:
             self.COMMAND: bytearray = bytearray(
                     self.COMMAND +
-                    bitstring.Bits(intle=self.red, length=8).bytes +
-                    bitstring.Bits(intle=self.green, length=8).bytes +
-                    bitstring.Bits(intle=self.blue, length=8).bytes
+                    _INT8.pack(self.red) +
+                    _INT8.pack(self.green) +
+                    _INT8.pack(self.blue)
                     )
         elif self.preset_mode == WRITEDIRECT_MODE.SET_LED_COLOR:
             self.COMMAND: bytearray = bytearray(
                     self.COMMAND +
-                    bitstring.Bits(intle=self.color, length=8).bytes
+                    _INT8.pack(self.color)
                     )
         elif self.preset_mode == WRITEDIRECT_MODE.SET_POSITION:
             if self.synced:
                 self.COMMAND: bytearray = bytearray(
                         self.COMMAND +
-                        bitstring.Bits(intle=int(round(self.motor_position * self.gearRatio)), length=32).bytes +
-                        bitstring.Bits(intle=int(round(self.motor_position_a * self.gearRatio)), length=32).bytes +
-                        bitstring.Bits(intle=int(round(self.motor_position_b * self.gearRatio)), length=32).bytes
+                        _INT32.pack(int(round(self.motor_position * self.gearRatio))) +
+                        _INT32.pack(int(round(self.motor_position_a * self.gearRatio))) +
+                        _INT32.pack(int(round(self.motor_position_b * self.gearRatio)))
                         )
             else:
                 self.COMMAND: bytearray = bytearray(
                         self.COMMAND +
-                        bitstring.Bits(intle=int(round(self.motor_position * self.gearRatio)), length=32).bytes
+                        _INT32.pack(int(round(self.motor_position * self.gearRatio)))
                         )
         elif self.preset_mode == WRITEDIRECT_MODE.SET_MOTOR_POWER:
             self.COMMAND: bytearray = bytearray(
                     self.COMMAND +
-                    bitstring.Bits(intle=self.motor_power, length=8).bytes
+                    _INT8.pack(self.motor_power)
                     )
         
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
         
         self.COMMAND = bytearray(self.handle +
                                  self.m_length +
                                  self.COMMAND
                                  )
-        print(self.COMMAND.hex())
         return
 
 
@@ -944,14 +946,14 @@ class CMD_HW_RESET(DOWNSTREAM_MESSAGE):
         if isinstance(self.port, PORT):
             self.port: bytes = self.port.value
         elif isinstance(self.port, int):
-            self.port: bytes = int.to_bytes(self.port, length=1, byteorder='little', signed=False)
+            self.port: bytes = _PORT_BYTES[self.port]
         else:
             self.port: bytes = self.port
         
         self.COMMAND: bytearray = bytearray(
                 self.header +
                 self.port +
-                bitstring.Bits(intle=(start_cond & completion_cond), length=8).bytes +
+                _INT8.pack(start_cond & completion_cond) +
                 self.sub_cmd +
                 b'\xd4' +
                 b'\x11'
@@ -959,7 +961,7 @@ class CMD_HW_RESET(DOWNSTREAM_MESSAGE):
 
         self.COMMAND += (self.COMMAND[-1] ^ self.COMMAND[-2] ^ 0xff).to_bytes(1, 'little', signed=False)
 
-        self.m_length: bytes = bitstring.Bits(intle=(1 + len(self.COMMAND)), length=8).bytes
+        self.m_length: bytes = _INT8.pack(1 + len(self.COMMAND))
 
         self.COMMAND = bytearray(self.handle +
                                  self.m_length +
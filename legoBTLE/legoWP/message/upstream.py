@@ -20,8 +20,6 @@ from collections import defaultdict
 from dataclasses import dataclass
 from dataclasses import field
 
-import numpy as np
-
 import legoBTLE
 from legoBTLE.legoWP import types
 from legoBTLE.legoWP.common_message_header import COMMON_MESSAGE_HEADER
@@ -54,19 +52,13 @@ class UpStreamMessageBuilder:
             The upstream message determined by the header.
             
         """
-        dispatch = {
-            int.from_bytes(MESSAGE_TYPE.UPS_DNS_HUB_ACTION, 'little'): HUB_ACTION_NOTIFICATION,
-            int.from_bytes(MESSAGE_TYPE.UPS_HUB_ATTACHED_IO, 'little'): HUB_ATTACHED_IO_NOTIFICATION,
-            int.from_bytes(MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR, 'little'): DEV_GENERIC_ERROR_NOTIFICATION,
-            int.from_bytes(MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK, 'little'): PORT_CMD_FEEDBACK,
-            int.from_bytes(MESSAGE_TYPE.UPS_PORT_VALUE, 'little'): PORT_VALUE,
-            int.from_bytes(MESSAGE_TYPE.UPS_PORT_NOTIFICATION, 'little'): DEV_PORT_NOTIFICATION,
-            int.from_bytes(MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD, 'little'): EXT_SERVER_CMD_ACK
-            if self._data[-1] == PERIPHERAL_EVENT.EXT_SRV_RECV else EXT_SERVER_NOTIFICATION,
-            int.from_bytes(MESSAGE_TYPE.UPS_DNS_HUB_ALERT, 'little'): HUB_ALERT_NOTIFICATION,
-        }
-
-        return dispatch[int.from_bytes(self._header.m_type, 'little')](self._data)
+        m_type = self._header.m_type[0]
+        if m_type == _UPS_DNS_EXT_SERVER_CMD:
+            # ACK and notification share the message type, the last byte tells them apart
+            if self._data[-1] == PERIPHERAL_EVENT.EXT_SRV_RECV:
+                return EXT_SERVER_CMD_ACK(self._data)
+            return EXT_SERVER_NOTIFICATION(self._data)
+        return _UPSTREAM_MESSAGES[m_type](self._data)
 
 
 def _key_name(cls, value: bytearray):
@@ -123,14 +115,12 @@ class EXT_SERVER_NOTIFICATION(UPSTREAM_MESSAGE):
     COMMAND: bytearray = field(init=True)
     
     def __post_init__(self):
-        print(f"GENERATING EXT_SERVER_NOTIFICATION: COMMAND: {self.COMMAND}")
         self.m_header: COMMON_MESSAGE_HEADER = COMMON_MESSAGE_HEADER(data=self.COMMAND[:3])
         self.m_port: bytes = self.COMMAND[3:4]
         # self.m_cmd_code = self.COMMAND[4:5]
         # self.m_cmd_code_str: str = _key_name(MESSAGE_TYPE, self.m_cmd_code)
         self.m_event = self.COMMAND[4:5]
         self.m_event_str = _key_name(PERIPHERAL_EVENT, self.m_event)
-        print(f"GENERATING EXT_SERVER_NOTIFICATION: PORT: {self.m_port} / Event: {self.m_event} / EVENT_STR:{self.m_event_str}")
         return
 
 
@@ -233,7 +223,8 @@ class PORT_VALUE(UPSTREAM_MESSAGE):
         self.m_port_value: float = float(int.from_bytes(self.COMMAND[4:], 'little', signed=True))
         self.m_port_value_DEG: float = self.m_port_value
         self.m_port_value_RAD: float = math.pi / 180 * self.m_port_value
-        self.m_direction = np.sign(self.m_port_value)
+        # scalar sign without a numpy ufunc call per notification; values match np.sign: -1.0, 0.0 or 1.0
+        self.m_direction: float = float((self.m_port_value > 0) - (self.m_port_value < 0))
     
     def get_port_value_EFF(self, gearRatio: float = 1.0) -> defaultdict:
         """Returns the port value adjusted by the installed gear train (currently a single set is supported).
@@ -312,3 +303,16 @@ class HUB_ALERT_NOTIFICATION(UPSTREAM_MESSAGE):
     
     # a: HUB_ALERT_NOTIFICATION = HUB_ALERT_NOTIFICATION(b'\x06\x00\x03\x03\x04\xff') #upstream
     # a: HUB_ALERT_NOTIFICATION = HUB_ALERT_NOTIFICATION(b'\x05\x00\x03\x02\x01') #downstream
+
+
+# message type -> upstream message class, built once for UpStreamMessageBuilder.dispatch instead of per message
+_UPS_DNS_EXT_SERVER_CMD: int = MESSAGE_TYPE.UPS_DNS_EXT_SERVER_CMD[0]
+_UPSTREAM_MESSAGES = {
+    MESSAGE_TYPE.UPS_DNS_HUB_ACTION[0]: HUB_ACTION_NOTIFICATION,
+    MESSAGE_TYPE.UPS_HUB_ATTACHED_IO[0]: HUB_ATTACHED_IO_NOTIFICATION,
+    MESSAGE_TYPE.UPS_HUB_GENERIC_ERROR[0]: DEV_GENERIC_ERROR_NOTIFICATION,
+    MESSAGE_TYPE.UPS_PORT_CMD_FEEDBACK[0]: PORT_CMD_FEEDBACK,
+    MESSAGE_TYPE.UPS_PORT_VALUE[0]: PORT_VALUE,
+    MESSAGE_TYPE.UPS_PORT_NOTIFICATION[0]: DEV_PORT_NOTIFICATION,
+    MESSAGE_TYPE.UPS_DNS_HUB_ALERT[0]: HUB_ALERT_NOTIFICATION,
+}
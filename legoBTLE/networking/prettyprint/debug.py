@@ -24,10 +24,11 @@ UL = f'\033[4m'
 
 
 def debug_info_header(header: str, debug: bool):
+    if not debug:
+        return
     header_len = len(header)
-    if debug:
-        print(f"{Style.BRIGHT}{Fore.BLUE}{' ' * (64 + header_len)}")
-        print(f"{Style.BRIGHT}{Fore.BLUE}{3 * '*'}{29 * ' '} {header} {Style.RESET_ALL}{Style.BRIGHT}{Fore.BLUE}{29 * ' '}{3 * '*'}")
+    print(f"{Style.BRIGHT}{Fore.BLUE}{' ' * (64 + header_len)}")
+    print(f"{Style.BRIGHT}{Fore.BLUE}{3 * '*'}{29 * ' '} {header} {Style.RESET_ALL}{Style.BRIGHT}{Fore.BLUE}{29 * ' '}{3 * '*'}")
     return
 
 
@@ -46,32 +47,36 @@ def debug_info_footer(footer: str, debug: bool):
     -------
     
     """
+    if not debug:
+        return
     _footer = footer.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}{' ' * (64 + len(_footer))}")
-        print(
-            f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}<< < END +.+.+.+.+ END << << << {C.UNDERLINE}{C.WARNING}{_footer}{C.OKBLUE} << < END +.+.+.+.+ END << << <<")
+    print(f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}{' ' * (64 + len(_footer))}")
+    print(
+        f"{C.BOLD}{C.OKBLUE}{C.UNDERLINE}<< < END +.+.+.+.+ END << << << {C.UNDERLINE}{C.WARNING}{_footer}{C.OKBLUE} << < END +.+.+.+.+ END << << <<")
     return
 
 
 def debug_info_begin(info: str, debug: bool):
+    if not debug:
+        return
     _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**    ", _info, f"{C.BOLD} >> >> BEGIN")
+    print(f"{C.BOLD}{C.OKBLUE}**    ", _info, f"{C.BOLD} >> >> BEGIN")
     return
 
 
 def debug_info(info: str, debug: bool):
+    if not debug:
+        return
     _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**        ", _info)
+    print(f"{C.BOLD}{C.OKBLUE}**        ", _info)
     return
 
 
 def debug_info_end(info: str, debug: bool):
+    if not debug:
+        return
     _info = info.replace('\t', 4 * ' ')
-    if debug:
-        print(f"{C.BOLD}{C.OKBLUE}**    {C.OKBLUE}", _info, f"{C.BOLD} << << END")
+    print(f"{C.BOLD}{C.OKBLUE}**    {C.OKBLUE}", _info, f"{C.BOLD} << << END")
     return
 
 
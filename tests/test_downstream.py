@@ -0,0 +1,69 @@
+import pytest
+
+from legoBTLE.legoWP.message import downstream
+from legoBTLE.legoWP.types import CONNECTION
+from legoBTLE.legoWP.types import HUB_ACTION
+from legoBTLE.legoWP.types import HUB_ALERT_OP
+from legoBTLE.legoWP.types import HUB_ALERT_TYPE
+from legoBTLE.legoWP.types import HUB_COLOR
+from legoBTLE.legoWP.types import MOVEMENT
+from legoBTLE.legoWP.types import PORT
+from legoBTLE.legoWP.types import SUB_COMMAND
+from legoBTLE.legoWP.types import WRITEDIRECT_MODE
+
+# (message class, arguments, COMMAND as encoded by the bitstring based original implementation)
+ENCODINGS = [
+    ('CMD_SET_ACC_DEACC_PROFILE',
+     dict(profile_type=SUB_COMMAND.SET_ACC_PROFILE, port=1, time_to_full_zero_speed=500, profile_nr=1),
+     '0e090081011105f40101'),
+    ('CMD_SET_ACC_DEACC_PROFILE',
+     dict(profile_type=SUB_COMMAND.SET_DEACC_PROFILE, port=b'\x02', time_to_full_zero_speed=1000, profile_nr=2),
+     '0e090081021106e80302'),
+    ('CMD_EXT_SRV_CONNECT_REQ', dict(port=b'\x01'), '0005005c0100'),
+    ('CMD_EXT_SRV_DISCONNECT_REQ', dict(port=b'\x01'), '0005005c01dd'),
+    ('CMD_HUB_ACTION_HUB_SND', dict(hub_action=HUB_ACTION.DNS_HUB_INDICATE_BUSY_ON), '0f04000205'),
+    ('HUB_ALERT_UPDATE_REQ', dict(hub_alert=HUB_ALERT_TYPE.LOW_V), '0f0500030103'),
+    ('HUB_ALERT_NOTIFICATION_REQ', dict(hub_alert=HUB_ALERT_TYPE.LOW_V, hub_alert_op=HUB_ALERT_OP.DNS_UPDATE_ENABLE),
+     '0f0500030101'),
+    ('CMD_PORT_NOTIFICATION_DEV_REQ', dict(port=b'\x01'), '0e0a004101020100000001'),
+    ('CMD_START_PWR_DEV', dict(port=1, power=-50), '0e0600810111ce'),
+    ('CMD_START_PWR_DEV', dict(synced=True, port=0x10, power_a=40, power_b=-40), '0e0900811011510228d8'),
+    ('CMD_START_SPEED_DEV', dict(port=1, speed=-70, abs_max_power=100), '0e090081011107ba6403'),
+    ('CMD_START_SPEED_DEV', dict(synced=True, port=0x10, speed_a=30, speed_b=-30, abs_max_power=90),
+     '0e0a00811011081ee25a03'),
+    ('CMD_START_MOVE_DEV_TIME', dict(port=1, time=2500, speed=60, power=100, on_completion=MOVEMENT.HOLD),
+     '0e0c0081011109c4093c647e03'),
+    ('CMD_START_MOVE_DEV_TIME', dict(synced=True, port=0x10, time=1000, speed_a=-20, speed_b=20, power=80),
+     '0e0d008110110ae803ec14507f03'),
+    ('CMD_START_MOVE_DEV_DEGREES',
+     dict(port=1, degrees=720, speed=-80, abs_max_power=100, on_completion=MOVEMENT.COAST),
+     '0e0e008101110bd0020000b0640003'),
+    ('CMD_START_MOVE_DEV_DEGREES',
+     dict(synced=True, port=0x10, degrees=90, speed_a=50, speed_b=-50, abs_max_power=70),
+     '0e0f008110110c5a00000032ce467f03'),
+    ('CMD_GOTO_ABS_POS_DEV', dict(port=1, speed=40, abs_pos=-1234, abs_max_power=100),
+     '0e0e008101110d2efbffff28647f03'),
+    ('CMD_GOTO_ABS_POS_DEV', dict(synced=True, port=0x10, speed=40, abs_pos_a=360, abs_pos_b=-360, abs_max_power=100),
+     '0e12008110110e6801000098feffff28647f03'),
+    ('CMD_SETUP_DEV_VIRTUAL_PORT', dict(connection=CONNECTION.CONNECT, port_a=b'\x00', port_b=b'\x01'),
+     '0e060061010001'),
+    ('CMD_SETUP_DEV_VIRTUAL_PORT', dict(connection=CONNECTION.DISCONNECT, port=b'\x10'), '0e0500610010'),
+    ('CMD_MODE_DATA_DIRECT', dict(port=1, preset_mode=WRITEDIRECT_MODE.SET_POSITION, motor_position=-90),
+     '0e0b008101115102a6ffffff'),
+    ('CMD_MODE_DATA_DIRECT', dict(port=1, preset_mode=WRITEDIRECT_MODE.SET_MOTOR_POWER, motor_power=-60),
+     '0e0800810111510004'),
+    ('CMD_MODE_DATA_DIRECT', dict(port=PORT.LED, preset_mode=WRITEDIRECT_MODE.SET_LED_COLOR, color=HUB_COLOR.TEAL),
+     '0e0800813211510007'),
+    ('CMD_GENERAL_NOTIFICATION_HUB_REQ', dict(), '0f04000100'),
+    ('CMD_HW_RESET', dict(port=b'\x01'), '0e090081011150d4113a'),
+]
+
+
+@pytest.mark.parametrize('name, kwargs, expected', ENCODINGS)
+def test_command_encoding(name, kwargs, expected):
+    assert bytes(getattr(downstream, name)(**kwargs).COMMAND) == bytes.fromhex(expected)
+
+
+def test_command_encoding_rejects_out_of_range_values():
+    with pytest.raises(Exception):
+        downstream.CMD_START_SPEED_DEV(port=1, speed=200, abs_max_power=100)
@@ -0,0 +1,164 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from legoBTLE.device.SingleMotor import SingleMotor
+
+
+class _Transport:
+
+    def is_closing(self) -> bool:
+        return False
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+
+class _Writer:
+    """Stands in for the server connection: records every write and answers like the command feedback would.
+
+    Every command is reported as started and finished right away and the port is freed again.
+    """
+
+    def __init__(self, motor: SingleMotor):
+        self.motor = motor
+        self.sent = []
+        self.transport = _Transport()
+
+    def write(self, data: bytes):
+        self.sent.append(bytes(data))
+        self.motor.E_CMD_STARTED.set()
+        self.motor.E_CMD_FINISHED.set()
+        self.motor.port_free.set()
+
+    async def drain(self):
+        return
+
+
+def _connected_motor(**kwargs) -> (SingleMotor, _Writer):
+    motor = SingleMotor(server=('127.0.0.1', 8888), port=1, name='A', debug=False, **kwargs)
+    writer = _Writer(motor)
+    motor.connection_set((None, writer))
+    return motor, writer
+
+
+def test_start_move_distance_sends_degrees_command():
+    async def run():
+        motor, writer = _connected_motor(wheel_diameter=100.0)
+        # 100mm on a 100mm wheel: floor(100 * 360 / (pi * 100)) = 114 degrees, handed down as numpy.float64
+        s = await motor.START_MOVE_DISTANCE(distance=100.0, speed=50, abs_max_power=30, time_to_stalled=None)
+        return s, b''.join(writer.sent)
+
+    s, sent = asyncio.run(run())
+    assert s is True
+    assert sent == bytes.fromhex('0e0e0e008101010b72000000321e7f03')
+
+
+def test_start_move_distance_negative_distance_reverses_speed():
+    async def run():
+        motor, writer = _connected_motor(wheel_diameter=100.0)
+        await motor.START_MOVE_DISTANCE(distance=-100.0, speed=50, abs_max_power=30, time_to_stalled=None)
+        return b''.join(writer.sent)
+
+    # floor(-114.6) = -115 degrees: 115 degrees at speed -50
+    assert asyncio.run(run()) == bytes.fromhex('0e0e0e008101010b73000000ce1e7f03')
+
+
+def test_req_port_notification_goes_on_when_coroutine_wait_cond_times_out():
+    async def run():
+        motor, writer = _connected_motor()
+        never = asyncio.Event()
+        s = await motor.REQ_PORT_NOTIFICATION(waitUntilCond=never.wait, waitUntil_timeout=0.01)
+        return s, b''.join(writer.sent)
+
+    s, sent = asyncio.run(run())
+    assert s is True
+    assert sent == bytes.fromhex('0e0a0a004101020100000001')
+
+
+def test_req_port_notification_goes_on_when_predicate_wait_cond_times_out():
+    async def run():
+        motor, writer = _connected_motor()
+        s = await motor.REQ_PORT_NOTIFICATION(waitUntilCond=lambda: False, waitUntil_timeout=0.01)
+        return s, b''.join(writer.sent)
+
+    s, sent = asyncio.run(run())
+    assert s is True
+    assert sent == bytes.fromhex('0e0a0a004101020100000001')
+
+
+def test_req_port_notification_frees_the_port_when_wait_cond_fails():
+    def broken():
+        raise ValueError
+
+    async def run():
+        motor, writer = _connected_motor()
+        with pytest.raises(ValueError):
+            await motor.REQ_PORT_NOTIFICATION(waitUntilCond=broken)
+        return motor.port_free.is_set(), writer.sent
+
+    port_free, sent = asyncio.run(run())
+    assert port_free
+    assert sent == []
+
+
+def test_start_move_distance_with_delay_before_and_debug(capsys):
+    async def run():
+        motor, writer = _connected_motor(wheel_diameter=100.0)
+        s = await motor.START_MOVE_DISTANCE(distance=100.0, speed=50, abs_max_power=30, time_to_stalled=None,
+                                            delay_before=0.001, debug=True)
+        return s, b''.join(writer.sent)
+
+    s, sent = asyncio.run(run())
+    assert s is True
+    assert sent == bytes.fromhex('0e0e0e008101010b72000000321e7f03')
+    assert 'delay BEFORE is set to 0.001' in capsys.readouterr().out
+
+
+def test_start_move_degrees_reuses_the_command_only_for_identical_arguments():
+    async def run():
+        motor, writer = _connected_motor()
+        sent, commands = [], []
+        for speed in (30, 30, -30):
+            writer.sent.clear()
+            await motor.START_MOVE_DEGREES(degrees=90, speed=speed, abs_max_power=50, time_to_stalled=None)
+            sent.append(b''.join(writer.sent))
+            commands.append(motor.last_cmd_snt)
+        return sent, commands
+
+    sent, commands = asyncio.run(run())
+    assert sent == [bytes.fromhex('0e0e0e008101010b5a0000001e327f03'),
+                    bytes.fromhex('0e0e0e008101010b5a0000001e327f03'),
+                    bytes.fromhex('0e0e0e008101010b5a000000e2327f03')]
+    assert commands[1] is commands[0]
+    assert commands[2] is not commands[1]
+
+
+def _port_value(degrees: float) -> SimpleNamespace:
+    return SimpleNamespace(m_port_value=degrees, m_port_value_DEG=degrees)
+
+
+def test_stall_guard_flags_a_motor_that_does_not_move():
+    async def run():
+        motor, _ = _connected_motor()
+        motor._cmd_time_to_stalled = 0.05
+        guard = asyncio.ensure_future(motor._stall_detection(debug=False))
+        motor.E_CMD_STARTED.set()
+        motor.E_CMD_FINISHED.clear()
+
+        await motor.port_value_set(_port_value(0))
+        await asyncio.sleep(0.2)
+        stalled_idle = motor.E_MOTOR_STALLED.is_set()
+
+        motor.E_MOTOR_STALLED.clear()
+        for i in range(10):
+            await motor.port_value_set(_port_value(1000 + 10 * (i + 1)))
+            await asyncio.sleep(0.01)
+        stalled_moving = motor.E_MOTOR_STALLED.is_set()
+
+        guard.cancel()
+        await asyncio.sleep(0)
+        return stalled_idle, stalled_moving
+
+    assert asyncio.run(run()) == (True, False)